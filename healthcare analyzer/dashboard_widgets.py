@@ -1,44 +1,52 @@
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
+from collections import namedtuple
 
-from theme_manager import ThemeManager
+from theme_manager import ThemeManager, CARD_FRAME, CARD_LABEL, SUBHEADER_LABEL
 from visual_components import VisualComponents
+from health_analyzer import STATUS_LABELS
+
+# Status code (NORMAL, CAUTION, WARNING, DANGER) for each status label
+_STATUS_CODES = {label: code for code, label in enumerate(STATUS_LABELS)}
+
+# One gauge in a GaugeCanvas
+GaugeSpec = namedtuple("GaugeSpec", "label min_val max_val value unit warning_threshold danger_threshold")
 
 class HealthMetricCard:
     """A card widget for displaying a health metric with reference information"""
     def __init__(self, parent, title, icon=None):
-        self.frame = ttk.Frame(parent, style="Card.TFrame")
+        self.frame = ttk.Frame(parent, style=CARD_FRAME)
         self.frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Title bar
-        title_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        title_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         title_frame.pack(fill=tk.X, pady=(5, 0), padx=10)
         
         # Icon (if provided)
         self.icon_label = None
         if icon:
-            self.icon_label = ttk.Label(title_frame, text=icon, style="Card.TLabel")
+            self.icon_label = ttk.Label(title_frame, text=icon, style=CARD_LABEL)
             self.icon_label.pack(side=tk.LEFT, padx=(0, 5))
         
         # Title
-        self.title_label = ttk.Label(title_frame, text=title, style="SubHeader.TLabel")
+        self.title_label = ttk.Label(title_frame, text=title, style=SUBHEADER_LABEL)
         self.title_label.pack(side=tk.LEFT)
         
         # Timestamp
-        self.timestamp_label = ttk.Label(title_frame, text="Last updated: --", style="Card.TLabel", font=("Arial", 8))
+        self.timestamp_label = ttk.Label(title_frame, text="Last updated: --", style=CARD_LABEL, font=("Arial", 8))
         self.timestamp_label.pack(side=tk.RIGHT)
         
         # Value frame
-        value_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        value_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         value_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=10)
         
         # Current value
-        self.value_label = ttk.Label(value_frame, text="--", style="Card.TLabel", font=("Arial", 24))
+        self.value_label = ttk.Label(value_frame, text="--", style=CARD_LABEL, font=("Arial", 24))
         self.value_label.pack(side=tk.LEFT, padx=(10, 5))
         
         # Unit
-        self.unit_label = ttk.Label(value_frame, text="", style="Card.TLabel")
+        self.unit_label = ttk.Label(value_frame, text="", style=CARD_LABEL)
         self.unit_label.pack(side=tk.LEFT, pady=(8, 0))  # Align with the bottom of value_label
         
         # Status indicator
@@ -46,75 +54,85 @@ class HealthMetricCard:
         self.status_frame.pack(side=tk.RIGHT, padx=10)
         
         # Reference range frame
-        ref_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        ref_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         ref_frame.pack(fill=tk.X, pady=5, padx=10)
         
         # Reference range label
-        self.ref_label = ttk.Label(ref_frame, text="Normal range: --", style="Card.TLabel", font=("Arial", 9))
+        self.ref_label = ttk.Label(ref_frame, text="Normal range: --", style=CARD_LABEL, font=("Arial", 9))
         self.ref_label.pack(side=tk.LEFT)
         
         # Separator
         ttk.Separator(self.frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=10, pady=5)
         
         # Bottom info frame
-        info_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        info_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         info_frame.pack(fill=tk.X, pady=5, padx=10)
         
         # Additional info label
-        self.info_label = ttk.Label(info_frame, text="", style="Card.TLabel", font=("Arial", 9))
+        self.info_label = ttk.Label(info_frame, text="", style=CARD_LABEL, font=("Arial", 9))
         self.info_label.pack(side=tk.LEFT)
+        
+        # (value, status) currently shown, to skip unchanged redraws
+        self._shown = None
     
     def update(self, value, unit, status, ref_range, timestamp=None, info=""):
-        """Update the card with new values"""
-        self.value_label.config(text=str(value))
+        """Update the card with new values (status may be a label or a status code)"""
         self.unit_label.config(text=unit)
-        self.status_frame.update_status(status)
         self.ref_label.config(text=f"Normal range: {ref_range}")
+        self.info_label.config(text=info)
+        
+        return self.update_value(value, status, timestamp)
+    
+    def update_value(self, value, status, timestamp=None):
+        """Update only the value, status and timestamp; unit, range and info are kept"""
+        if (value, status) != self._shown:
+            code = _STATUS_CODES.get(status, status)
+            self.value_label.config(text=str(value))
+            self.status_frame.update_status(STATUS_LABELS[code])
+            self._shown = (value, status)
         
         if timestamp:
-            time_str = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').strftime('%H:%M:%S %d-%m-%Y')
+            time_str = datetime.fromisoformat(timestamp).strftime('%H:%M:%S %d-%m-%Y')
             self.timestamp_label.config(text=f"Last updated: {time_str}")
         
-        self.info_label.config(text=info)
-        
         return self.frame
         
 class UserInfoPanel:
     """A panel displaying user information"""
     def __init__(self, parent):
-        self.frame = ttk.Frame(parent, style="Card.TFrame")
+        self.frame = ttk.Frame(parent, style=CARD_FRAME)
         
         # User header
-        header_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        header_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         header_frame.pack(fill=tk.X, pady=5, padx=10)
         
-        self.user_icon = ttk.Label(header_frame, text="👤", style="Card.TLabel", font=("Arial", 20))
+        self.user_icon = ttk.Label(header_frame, text="👤", style=CARD_LABEL, font=("Arial", 20))
         self.user_icon.pack(side=tk.LEFT, padx=(0, 10))
         
-        self.user_name = ttk.Label(header_frame, text="User Name", style="Card.TLabel", font=("Arial", 16, "bold"))
+        self.user_name = ttk.Label(header_frame, text="User Name", style=CARD_LABEL, font=("Arial", 16, "bold"))
         self.user_name.pack(side=tk.LEFT)
         
         # User details (two-column grid)
-        details_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        details_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         details_frame.pack(fill=tk.X, pady=10, padx=10)
         
         # Labels
-        ttk.Label(details_frame, text="Age:", style="Card.TLabel", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=2)
-        ttk.Label(details_frame, text="Gender:", style="Card.TLabel", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=2)
-        ttk.Label(details_frame, text="Height:", style="Card.TLabel", font=("Arial", 10, "bold")).grid(row=0, column=2, sticky="w", pady=2, padx=(15,0))
-        ttk.Label(details_frame, text="Weight:", style="Card.TLabel", font=("Arial", 10, "bold")).grid(row=1, column=2, sticky="w", pady=2, padx=(15,0))
+        ttk.Label(details_frame, text="Age:", style=CARD_LABEL, font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=2)
+        ttk.Label(details_frame, text="Gender:", style=CARD_LABEL, font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=2)
+        ttk.Label(details_frame, text="Height:", style=CARD_LABEL, font=("Arial", 10, "bold")).grid(row=0, column=2, sticky="w", pady=2, padx=(15,0))
+        ttk.Label(details_frame, text="Weight:", style=CARD_LABEL, font=("Arial", 10, "bold")).grid(row=1, column=2, sticky="w", pady=2, padx=(15,0))
         
         # Values
-        self.age_label = ttk.Label(details_frame, text="--", style="Card.TLabel")
+        self.age_label = ttk.Label(details_frame, text="--", style=CARD_LABEL)
         self.age_label.grid(row=0, column=1, sticky="w", padx=(5,0))
         
-        self.gender_label = ttk.Label(details_frame, text="--", style="Card.TLabel")
+        self.gender_label = ttk.Label(details_frame, text="--", style=CARD_LABEL)
         self.gender_label.grid(row=1, column=1, sticky="w", padx=(5,0))
         
-        self.height_label = ttk.Label(details_frame, text="--", style="Card.TLabel")
+        self.height_label = ttk.Label(details_frame, text="--", style=CARD_LABEL)
         self.height_label.grid(row=0, column=3, sticky="w", padx=(5,0))
         
-        self.weight_label = ttk.Label(details_frame, text="--", style="Card.TLabel")
+        self.weight_label = ttk.Label(details_frame, text="--", style=CARD_LABEL)
         self.weight_label.grid(row=1, column=3, sticky="w", padx=(5,0))
         
     def update(self, name, age, gender, height, weight):
@@ -130,16 +148,16 @@ class UserInfoPanel:
 class HealthStatusPanel:
     """A panel for displaying overall health status"""
     def __init__(self, parent):
-        self.frame = ttk.Frame(parent, style="Card.TFrame")
+        self.frame = ttk.Frame(parent, style=CARD_FRAME)
         
         # Header
-        header_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        header_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         header_frame.pack(fill=tk.X, pady=5, padx=10)
         
-        ttk.Label(header_frame, text="Overall Health Status", style="SubHeader.TLabel").pack(side=tk.LEFT)
+        ttk.Label(header_frame, text="Overall Health Status", style=SUBHEADER_LABEL).pack(side=tk.LEFT)
         
         # Status display
-        status_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        status_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         status_frame.pack(fill=tk.X, pady=10, padx=20)
         
         self.status_label = ttk.Label(status_frame, text="NORMAL", style="Normal.TLabel", font=("Arial", 24, "bold"))
@@ -149,19 +167,19 @@ class HealthStatusPanel:
         ttk.Separator(self.frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=10, pady=10)
         
         # Alerts section
-        alerts_header = ttk.Frame(self.frame, style="Card.TFrame")
+        alerts_header = ttk.Frame(self.frame, style=CARD_FRAME)
         alerts_header.pack(fill=tk.X, pady=5, padx=10)
         
-        ttk.Label(alerts_header, text="Active Alerts", style="Card.TLabel", font=("Arial", 12, "bold")).pack(side=tk.LEFT)
+        ttk.Label(alerts_header, text="Active Alerts", style=CARD_LABEL, font=("Arial", 12, "bold")).pack(side=tk.LEFT)
         
         # Alerts content
-        alerts_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        alerts_frame = ttk.Frame(self.frame, style=CARD_FRAME)
         alerts_frame.pack(fill=tk.BOTH, expand=True, pady=5, padx=10)
         
         # Scrollable text area for alerts
         self.alerts_text = tk.Text(alerts_frame, wrap=tk.WORD, height=10, 
                                    bg=ThemeManager.COLORS['card'], bd=0, 
-                                   highlightthickness=0, font=("Arial", 10))
+                                   highlightthickness=0, font=("Arial", 10), undo=False)
         self.alerts_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
         # Scrollbar for alerts text
@@ -176,30 +194,220 @@ class HealthStatusPanel:
         self.alerts_text.tag_configure("danger", foreground=ThemeManager.STATUS_COLORS['Danger'])
         self.alerts_text.tag_configure("title", font=("Arial", 11, "bold"))
         
+        # Status and alerts currently displayed, so repeats skip the redraw
+        self._shown = None
+        
     def update(self, status, alerts_list=None):
         """Update health status and alerts"""
-        self.status_label.config(text=status.upper(), style=f"{status}.TLabel")
+        if (status, alerts_list or []) == self._shown:
+            return self.frame
+        self._shown = (status, alerts_list or [])
         
-        self.alerts_text.config(state=tk.NORMAL)
-        self.alerts_text.delete(1.0, tk.END)
+        self.status_label.config(text=status.upper(), style=ThemeManager.STATUS_LABEL_STYLES[status])
         
         if not alerts_list:
-            self.alerts_text.insert(tk.END, "No health alerts at this time.\n\n", "normal")
-            self.alerts_text.insert(tk.END, "All health metrics are within normal ranges.", "normal")
+            segments = [
+                ("normal", "No health alerts at this time.\n\n"),
+                ("normal", "All health metrics are within normal ranges.")
+            ]
         else:
-            # Insert overall message
-            self.alerts_text.insert(tk.END, "Health Concerns\n\n", "title")
+            # Overall message
+            segments = [("title", "Health Concerns\n\n")]
             
             # Add each alert with appropriate styling
             for alert in alerts_list:
                 if 'status' in alert and 'message' in alert:
-                    self.alerts_text.insert(tk.END, f"• {alert['message']}\n", alert['status'].lower())
+                    segments.append((alert['status'].lower(), f"• {alert['message']}\n"))
                 else:
-                    self.alerts_text.insert(tk.END, f"• {alert}\n", "warning")
+                    segments.append(("warning", f"• {alert}\n"))
         
-        self.alerts_text.config(state=tk.DISABLED)
+        # Refreshes keep the alerts scrolled where the user left them
+        VisualComponents.set_rich_text(self.alerts_text, segments, keep_view=True)
         
         return self.frame
 
+class VirtualTreeview:
+    """Wraps a Treeview so that only the rows in view are inserted as items"""
+    def __init__(self, tree, scrollbar, buffer=5):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.buffer = buffer
+        
+        # Full dataset as (values, tags) pairs; the tree only holds a window of it
+        self.rows = []
+        self.top = 0
+        self.visible_rows = int(tree.cget("height"))
+        self.selected = set()
+        self.focused = None
+        
+        # Route scrolling through the window instead of the tree's own view
+        self.scrollbar.config(command=self.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+        
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+    
+    def set_rows(self, rows):
+        """Replace the dataset with a list of (values, tags) pairs"""
+        rows = list(rows)
+        
+        # Reloading the same rows would only redo the inserts and drop the selection
+        if rows == self.rows:
+            return
+        
+        self.rows = rows
+        self.top = 0
+        self.selected = set()
+        self.focused = None
+        self._render_window()
+    
+    def row_values(self, iid):
+        """Return the values of the row behind a tree item id"""
+        return self.rows[int(iid)][0]
+    
+    def yview(self, *args):
+        """Scrollbar command handling 'moveto' and 'scroll' requests"""
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.rows))
+            self._render_window()
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.visible_rows
+            self._scroll_by(step)
+    
+    def _scroll_by(self, step):
+        self.top += step
+        self._render_window()
+        return "break"
+    
+    def _on_mousewheel(self, event):
+        return self._scroll_by(-1 if event.delta > 0 else 1)
+    
+    def _on_configure(self, event):
+        style = ttk.Style()
+        row_height = style.lookup(self.tree.cget("style") or "Treeview", "rowheight") or 20
+        visible_rows = max(1, event.height // int(row_height))
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self._render_window()
+    
+    def _on_tree_scroll(self, first, last):
+        # Keyboard navigation can scroll the tree past the rendered window;
+        # fold that offset into the window position and re-render
+        offset = round(float(first) * len(self.tree.get_children()))
+        if offset > 0:
+            self.top += offset
+            self._render_window()
+    
+    def _render_window(self):
+        """Insert only the rows between the top of the view and the bottom plus a buffer"""
+        total = len(self.rows)
+        self.top = max(0, min(self.top, total - self.visible_rows))
+        
+        # Remember selection and focus for rows that are about to be removed
+        children = set(self.tree.get_children())
+        self.selected = {i for i in self.selected if str(i) not in children}
+        self.selected.update(int(iid) for iid in self.tree.selection())
+        focus = self.tree.focus()
+        if focus:
+            self.focused = int(focus)
+        
+        self.tree.delete(*children)
+        end = min(total, self.top + self.visible_rows + self.buffer)
+        for index in range(self.top, end):
+            values, tags = self.rows[index]
+            self.tree.insert("", "end", iid=str(index), values=values, tags=tags)
+        self.tree.yview_moveto(0)
+        
+        # Restore selection and focus if those rows are in the window
+        in_window = [str(i) for i in sorted(self.selected) if self.top <= i < end]
+        if in_window:
+            self.tree.selection_set(in_window)
+        if self.focused is not None and self.top <= self.focused < end:
+            self.tree.focus(str(self.focused))
+        
+        if total:
+            self.scrollbar.set(self.top / total, min(total, self.top + self.visible_rows) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
 
-
+class GaugeCanvas:
+    """Draws a scrollable column of gauges as canvas items, only for the gauges in view"""
+    def __init__(self, canvas, scrollbar, slot_height=160):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.slot_height = slot_height
+        self.gauges = []
+        
+        # Indices of the gauges currently drawn and the (cx, radius) they were drawn with
+        self._drawn = range(0)
+        self._geometry = (0, 0)
+        
+        self.canvas.configure(yscrollcommand=self.scrollbar.set, yscrollincrement=slot_height // 4)
+        self.scrollbar.config(command=self.yview)
+        
+        self.canvas.bind("<Configure>", lambda e: self._redraw())
+        self.canvas.bind("<MouseWheel>", lambda e: self._scroll_by(-1 if e.delta > 0 else 1))
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_by(-1))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_by(1))
+    
+    def set_gauges(self, gauges):
+        """Replace the gauges with a list of GaugeSpec"""
+        self.gauges = list(gauges)
+        self.canvas.yview_moveto(0)
+        self._redraw()
+    
+    def set_values(self, values):
+        """Update the gauge values, changing the value arc and text items of the gauges in view in place"""
+        self.gauges = [gauge._replace(value=value) for gauge, value in zip(self.gauges, values)]
+        cx, radius = self._geometry
+        for index in self._drawn:
+            gauge = self.gauges[index]
+            cy = index * self.slot_height + 90
+            arc = self.canvas.find_withtag(f"gauge_arc{index}")
+            value = VisualComponents.draw_gauge_value(self.canvas, cx, cy, radius, gauge.min_val, gauge.max_val,
+                                                      gauge.value, gauge.warning_threshold, gauge.danger_threshold,
+                                                      ("gauge", f"gauge_arc{index}"), item=arc[0] if arc else None)
+            self.canvas.itemconfigure(f"gauge_text{index}", text=f"{value} {gauge.unit}")
+    
+    def yview(self, *args):
+        """Scrollbar command"""
+        self.canvas.yview(*args)
+        self._redraw()
+    
+    def _scroll_by(self, units):
+        self.canvas.yview_scroll(units, "units")
+        self._redraw()
+        return "break"
+    
+    def _redraw(self):
+        """Draw only the gauges whose slot overlaps the visible part of the canvas"""
+        self.canvas.delete("gauge")
+        width = self.canvas.winfo_width()
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.gauges) * self.slot_height))
+        
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, int(top // self.slot_height))
+        last = min(len(self.gauges), int(bottom // self.slot_height) + 1)
+        
+        cx = width / 2
+        radius = min(cx, 80) - 10
+        self._drawn = range(first, last)
+        self._geometry = (cx, radius)
+        label_color = ThemeManager.COLORS['primary']
+        value_color = ThemeManager.COLORS['text_dark']
+        for index in self._drawn:
+            gauge = self.gauges[index]
+            cy = index * self.slot_height + 90
+            VisualComponents.draw_gauge_arc(self.canvas, cx, cy, radius, gauge.min_val, gauge.max_val,
+                                            gauge.value, gauge.warning_threshold, gauge.danger_threshold,
+                                            value_tags=("gauge", f"gauge_arc{index}"))
+            self.canvas.create_text(cx, cy + 32, text=gauge.label, font=("Arial", 12, "bold"),
+                                    fill=label_color, tags="gauge")
+            value = max(gauge.min_val, min(gauge.value, gauge.max_val))
+            self.canvas.create_text(cx, cy + 54, text=f"{value} {gauge.unit}", font=("Arial", 14),
+                                    fill=value_color, tags=("gauge", f"gauge_text{index}"))
@@ -1,6 +1,36 @@
 import sqlite3
 import datetime
 import random
+import threading
+import functools
+import time
+
+# health_data columns in the order of the record tuples the read methods return
+HEALTH_DATA_COLUMNS = ("record_id, user_id, timestamp, heart_rate, blood_pressure_systolic, "
+                       "blood_pressure_diastolic, oxygen_level, temperature")
+
+def ttl_cache(seconds=5):
+    """
+    Cache the result of a DatabaseManager read method per (method, args) for a
+    few seconds; entries for a user are dropped by DatabaseManager.invalidate
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            key = (method.__name__,) + args
+            with self._lock:
+                now = time.monotonic()
+                hit = self._query_cache.get(key)
+                if hit and now - hit[0] < seconds:
+                    return hit[1]
+                
+                result = method(self, *args)
+                if len(self._query_cache) > 256:  # Expired entries are never read again
+                    self._query_cache.clear()
+                self._query_cache[key] = (now, result)
+                return result
+        return wrapper
+    return decorator
 
 class DatabaseManager:
     """Class to manage database operations for the health monitoring system"""
@@ -10,6 +40,15 @@ class DatabaseManager:
         self.db_path = db_path
         self.create_database()
         
+        # One persistent connection, shared with the app's worker thread (guarded by
+        # self._lock); sqlite3 caches the prepared statements per connection
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.RLock()
+        self._query_cache = {}
+        
         # Test connection
         self._execute_query("SELECT 1")
     
@@ -100,29 +139,30 @@ class DatabaseManager:
             print(f"Database creation error: {e}")
             raise
 
-    def _execute_query(self, query, params=None, fetch=True):
-        """Execute a query and optionally return results"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        cursor = conn.cursor()
-        
-        try:
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+    def _execute_query(self, query, params=None, fetch=True, as_tuples=False):
+        """
+        Execute a query on the shared connection and optionally return results
+        as_tuples returns plain tuples instead of sqlite3.Row objects
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            if as_tuples:
+                cursor.row_factory = None
+            cursor.execute(query, params or ())
             
             if fetch:
-                result = cursor.fetchall()
+                return cursor.fetchall()
+            self.conn.commit()
+            return None
+    
+    def invalidate(self, user_id=None):
+        """Drop cached reads for a user (or for everyone if user_id is None)"""
+        with self._lock:
+            if user_id is None:
+                self._query_cache.clear()
             else:
-                conn.commit()
-                result = None
-        except sqlite3.Error as e:
-            conn.close()
-            raise e
-        
-        conn.close()
-        return result
+                for key in [key for key in self._query_cache if key[1:2] == (user_id,)]:
+                    del self._query_cache[key]
     
     def get_user_names(self):
         """Get a list of all user IDs and names"""
@@ -130,6 +170,13 @@ class DatabaseManager:
         result = self._execute_query(query)
         return [(row['user_id'], row['name']) for row in result]
     
+    def get_user_bundle(self, user_id):
+        """Get (user_info, latest_health_data) for a user in a single read transaction"""
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN")
+            return self.get_user_info(user_id), self.get_latest_health_data(user_id)
+    
+    @ttl_cache()
     def get_user_info(self, user_id):
         """Get detailed information about a user"""
         query = "SELECT * FROM users WHERE user_id = ?"
@@ -150,77 +197,39 @@ class DatabaseManager:
             )
         return None
     
+    @ttl_cache()
     def get_latest_health_data(self, user_id):
         """Get the latest health data for a user"""
-        query = """
-        SELECT * FROM health_data 
+        query = f"""
+        SELECT {HEALTH_DATA_COLUMNS} FROM health_data 
         WHERE user_id = ? 
         ORDER BY timestamp DESC 
         LIMIT 1
         """
-        result = self._execute_query(query, (user_id,))
-        
-        if result:
-            row = result[0]
-            return (
-                row['record_id'],
-                row['user_id'],
-                row['timestamp'],
-                row['heart_rate'],
-                row['blood_pressure_systolic'],
-                row['blood_pressure_diastolic'],
-                row['oxygen_level'],
-                row['temperature']
-            )
-        return None
+        result = self._execute_query(query, (user_id,), as_tuples=True)
+        return result[0] if result else None
     
+    @ttl_cache()
     def get_health_data_by_timeframe(self, user_id, days):
         """Get health data for a user within the specified number of days"""
         cutoff_date = (datetime.datetime.now() - datetime.timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
         
-        query = """
-        SELECT * FROM health_data 
+        query = f"""
+        SELECT {HEALTH_DATA_COLUMNS} FROM health_data 
         WHERE user_id = ? AND timestamp >= ? 
         ORDER BY timestamp
         """
-        result = self._execute_query(query, (user_id, cutoff_date))
-        
-        return [
-            (
-                row['record_id'],
-                row['user_id'],
-                row['timestamp'],
-                row['heart_rate'],
-                row['blood_pressure_systolic'],
-                row['blood_pressure_diastolic'],
-                row['oxygen_level'],
-                row['temperature']
-            )
-            for row in result
-        ]
+        return self._execute_query(query, (user_id, cutoff_date), as_tuples=True)
     
+    @ttl_cache()
     def get_health_data_by_date_range(self, user_id, start_date, end_date):
         """Get health data for a user within a specific date range"""
-        query = """
-        SELECT * FROM health_data 
+        query = f"""
+        SELECT {HEALTH_DATA_COLUMNS} FROM health_data 
         WHERE user_id = ? AND timestamp >= ? AND timestamp <= ? 
         ORDER BY timestamp
         """
-        result = self._execute_query(query, (user_id, start_date, end_date))
-        
-        return [
-            (
-                row['record_id'],
-                row['user_id'],
-                row['timestamp'],
-                row['heart_rate'],
-                row['blood_pressure_systolic'],
-                row['blood_pressure_diastolic'],
-                row['oxygen_level'],
-                row['temperature']
-            )
-            for row in result
-        ]
+        return self._execute_query(query, (user_id, start_date, end_date), as_tuples=True)
     
     def get_user_medications(self, user_id):
         """Get all medications for a user"""
@@ -277,6 +286,7 @@ class DatabaseManager:
         VALUES (?, ?, ?, ?, ?, ?, ?)
         """
         self._execute_query(query, (user_id, timestamp, heart_rate, bp_sys, bp_dia, oxygen, temp), fetch=False)
+        self.invalidate(user_id)
     
     def add_medication(self, user_id, name, dosage, frequency, start_date, end_date, purpose, doctor, side_effects):
         """Add a new medication for a user"""
@@ -286,6 +296,7 @@ class DatabaseManager:
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         self._execute_query(query, (user_id, name, dosage, frequency, start_date, end_date, purpose, doctor, side_effects), fetch=False)
+        self.invalidate(user_id)
     
     def add_medical_condition(self, user_id, name, diagnosis_date, severity, treatment_plan, notes):
         """Add a new medical condition for a user"""
@@ -295,46 +306,54 @@ class DatabaseManager:
         VALUES (?, ?, ?, ?, ?, ?)
         """
         self._execute_query(query, (user_id, name, diagnosis_date, severity, treatment_plan, notes), fetch=False)
+        self.invalidate(user_id)
     
     def get_health_stats(self, user_id, days=30):
-        """Get health statistics for a user over a period"""
-        health_data = self.get_health_data_by_timeframe(user_id, days)
+        """Get health statistics for a user over a period (aggregated in SQL)"""
+        cutoff_date = (datetime.datetime.now() - datetime.timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
         
-        if not health_data:
-            return None
+        query = """
+        SELECT COUNT(*) AS readings_count,
+               MIN(heart_rate) AS hr_min, MAX(heart_rate) AS hr_max, AVG(heart_rate) AS hr_avg,
+               MIN(blood_pressure_systolic) AS sys_min, MAX(blood_pressure_systolic) AS sys_max,
+               AVG(blood_pressure_systolic) AS sys_avg,
+               MIN(blood_pressure_diastolic) AS dia_min, MAX(blood_pressure_diastolic) AS dia_max,
+               AVG(blood_pressure_diastolic) AS dia_avg,
+               MIN(oxygen_level) AS ox_min, MAX(oxygen_level) AS ox_max, AVG(oxygen_level) AS ox_avg,
+               MIN(temperature) AS temp_min, MAX(temperature) AS temp_max, AVG(temperature) AS temp_avg
+        FROM health_data 
+        WHERE user_id = ? AND timestamp >= ?
+        """
+        row = self._execute_query(query, (user_id, cutoff_date))[0]
         
-        # Calculate statistics
-        heart_rates = [record[3] for record in health_data]
-        bp_systolic = [record[4] for record in health_data]
-        bp_diastolic = [record[5] for record in health_data]
-        oxygen_levels = [record[6] for record in health_data]
-        temperatures = [record[7] for record in health_data]
+        if not row['readings_count']:
+            return None
         
         stats = {
             'heart_rate': {
-                'min': min(heart_rates),
-                'max': max(heart_rates),
-                'avg': sum(heart_rates) / len(heart_rates)
+                'min': row['hr_min'],
+                'max': row['hr_max'],
+                'avg': row['hr_avg']
             },
             'blood_pressure': {
-                'systolic_min': min(bp_systolic),
-                'systolic_max': max(bp_systolic),
-                'systolic_avg': sum(bp_systolic) / len(bp_systolic),
-                'diastolic_min': min(bp_diastolic),
-                'diastolic_max': max(bp_diastolic),
-                'diastolic_avg': sum(bp_diastolic) / len(bp_diastolic)
+                'systolic_min': row['sys_min'],
+                'systolic_max': row['sys_max'],
+                'systolic_avg': row['sys_avg'],
+                'diastolic_min': row['dia_min'],
+                'diastolic_max': row['dia_max'],
+                'diastolic_avg': row['dia_avg']
             },
             'oxygen_level': {
-                'min': min(oxygen_levels),
-                'max': max(oxygen_levels),
-                'avg': sum(oxygen_levels) / len(oxygen_levels)
+                'min': row['ox_min'],
+                'max': row['ox_max'],
+                'avg': row['ox_avg']
             },
             'temperature': {
-                'min': min(temperatures),
-                'max': max(temperatures),
-                'avg': sum(temperatures) / len(temperatures)
+                'min': row['temp_min'],
+                'max': row['temp_max'],
+                'avg': row['temp_avg']
             },
-            'readings_count': len(health_data)
+            'readings_count': row['readings_count']
         }
         
         return stats
@@ -462,10 +481,10 @@ class DatabaseManager:
         
         # Group data by week for trend analysis
         weeks = {}
-        start_date = datetime.datetime.strptime(health_data[0][2], '%Y-%m-%d %H:%M:%S')
+        start_date = datetime.datetime.fromisoformat(health_data[0][2])
         
         for record in health_data:
-            record_date = datetime.datetime.strptime(record[2], '%Y-%m-%d %H:%M:%S')
+            record_date = datetime.datetime.fromisoformat(record[2])
             week_num = (record_date - start_date).days // 7
             
             if week_num not in weeks:
@@ -853,7 +872,7 @@ class HealthAnalyzer:
         
         for record in health_data_history:
             timestamp = record[2]
-            record_date = datetime.datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
+            record_date = datetime.datetime.fromisoformat(timestamp)
             
             if start_date is None:
                 start_date = record_date
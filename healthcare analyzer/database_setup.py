@@ -37,6 +37,13 @@ def create_database():
     )
     ''')
     
+    # Covering index for the per-user time range queries, so they never read table pages
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_health_data_user_time_covering
+    ON health_data (user_id, timestamp, heart_rate, blood_pressure_systolic,
+                    blood_pressure_diastolic, oxygen_level, temperature)
+    ''')
+    
     # Create medications table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS medications (
@@ -1,3 +1,25 @@
+import functools
+import numpy as np
+
+# Integer status codes, ordered by severity so the worst status is the maximum
+NORMAL, CAUTION, WARNING, DANGER = 0, 1, 2, 3
+STATUS_LABELS = ("Normal", "Caution", "Warning", "Danger")
+
+STATUS_DTYPE = np.dtype([
+    ('overall', 'i1'),
+    ('hr', 'i1'),
+    ('bp', 'i1'),
+    ('ox', 'i1'),
+    ('temp', 'i1')
+])
+
+def metrics_array(health_data_history):
+    """
+    Return the heart rate, systolic, diastolic, oxygen and temperature columns
+    of health_data records as an (N, 5) float64 array
+    """
+    return np.array([record[3:8] for record in health_data_history], dtype=np.float64).reshape(-1, 5)
+
 class HealthAnalyzer:
     def __init__(self):
         # Define health thresholds
@@ -29,6 +51,10 @@ class HealthAnalyzer:
                 'high': 39.0
             }
         }
+        
+        # Overall status cached per set of metric values; the cache belongs to this
+        # instance so it follows these thresholds and does not keep the analyzer alive
+        self._overall_status = functools.lru_cache(maxsize=128)(self._compute_overall_status)
     
     def analyze_heart_rate(self, heart_rate):
         """Analyze heart rate and return status and message"""
@@ -110,13 +136,16 @@ class HealthAnalyzer:
         """
         Analyze all health metrics and provide an overall assessment
         health_data should be a tuple with (record_id, user_id, timestamp, heart_rate, 
-        blood_pressure_systolic, blood_pressure_diastolic, oxygen_level, temperature)
+        blood_pressure_systolic, blood_pressure_diastolic, oxygen_level, temperature);
+        results are cached per combination of metric values
         """
         if not health_data:
             return "Unknown", "No health data available"
         
-        record_id, user_id, timestamp, heart_rate, bp_sys, bp_dia, oxygen, temp = health_data
-        
+        return self._overall_status(*health_data[3:8])
+    
+    def _compute_overall_status(self, heart_rate, bp_sys, bp_dia, oxygen, temp):
+        """Overall (status, message) for one set of metric values"""
         # Analyze individual metrics
         hr_status, hr_msg = self.analyze_heart_rate(heart_rate)
         bp_status, bp_msg, sys_msg, dia_msg = self.analyze_blood_pressure(bp_sys, bp_dia)
@@ -153,42 +182,29 @@ class HealthAnalyzer:
         
         return overall_status, overall_msg
     
-    def predict_potential_conditions(self, health_data_history):
+    def predict_potential_conditions(self, health_data_history, metrics=None):
         """
         Analyze historical health data to predict potential health conditions
-        health_data_history should be a list of health data records
+        health_data_history should be a list of health data records;
+        metrics is an optional precomputed metrics_array(health_data_history)
         """
-        if not health_data_history:
+        if not len(health_data_history):
             return []
         
+        if metrics is None:
+            metrics = metrics_array(health_data_history)
+        heart_rate, bp_sys, bp_dia, oxygen, temp = metrics.T
+        
         # Count how many readings fall into concerning ranges
-        high_bp_count = 0
-        high_hr_count = 0
-        low_ox_count = 0
-        high_temp_count = 0
+        high_bp_count = np.count_nonzero(
+            (bp_sys >= self.thresholds['blood_pressure']['high_systolic_1']) |
+            (bp_dia >= self.thresholds['blood_pressure']['high_diastolic_1']))
+        high_hr_count = np.count_nonzero(heart_rate > self.thresholds['heart_rate']['high'])
+        low_ox_count = np.count_nonzero(oxygen < self.thresholds['oxygen_level']['concerning'])
+        high_temp_count = np.count_nonzero(temp > self.thresholds['temperature']['elevated'])
         
         total_readings = len(health_data_history)
         
-        for record in health_data_history:
-            _, _, _, heart_rate, bp_sys, bp_dia, oxygen, temp = record
-            
-            # Check blood pressure
-            if bp_sys >= self.thresholds['blood_pressure']['high_systolic_1'] or \
-               bp_dia >= self.thresholds['blood_pressure']['high_diastolic_1']:
-                high_bp_count += 1
-            
-            # Check heart rate
-            if heart_rate > self.thresholds['heart_rate']['high']:
-                high_hr_count += 1
-            
-            # Check oxygen level
-            if oxygen < self.thresholds['oxygen_level']['concerning']:
-                low_ox_count += 1
-            
-            # Check temperature
-            if temp > self.thresholds['temperature']['elevated']:
-                high_temp_count += 1
-        
         # Calculate percentages
         high_bp_percent = (high_bp_count / total_readings) * 100
         high_hr_percent = (high_hr_count / total_readings) * 100
@@ -226,4 +242,48 @@ class HealthAnalyzer:
                 "description": "Multiple elevated temperature readings suggest infection or inflammation."
             })
         
-        return potential_conditions
\ No newline at end of file
+        return potential_conditions
+    
+    def analyze_batch(self, health_data_history, metrics=None):
+        """
+        Compute status codes for every record in a single vectorized pass
+        Returns a structured array (see STATUS_DTYPE) with one row per record;
+        metrics is an optional precomputed metrics_array(health_data_history)
+        """
+        statuses = np.zeros(len(health_data_history), dtype=STATUS_DTYPE)
+        if not len(health_data_history):
+            return statuses
+        
+        if metrics is None:
+            metrics = metrics_array(health_data_history)
+        hr, bp_sys, bp_dia, oxygen, temp = metrics.T
+        
+        hr_t = self.thresholds['heart_rate']
+        bp_t = self.thresholds['blood_pressure']
+        ox_t = self.thresholds['oxygen_level']
+        temp_t = self.thresholds['temperature']
+        
+        hr_code = np.select(
+            [hr < hr_t['low'], hr > hr_t['very_high'], hr > hr_t['high']],
+            [WARNING, DANGER, WARNING], default=NORMAL)
+        sys_code = np.select(
+            [bp_sys >= bp_t['high_systolic_2'], bp_sys >= bp_t['high_systolic_1'], bp_sys >= bp_t['elevated_systolic']],
+            [DANGER, WARNING, CAUTION], default=NORMAL)
+        dia_code = np.select(
+            [bp_dia >= bp_t['high_diastolic_2'], bp_dia >= bp_t['high_diastolic_1']],
+            [DANGER, WARNING], default=NORMAL)
+        bp_code = np.maximum(sys_code, dia_code)
+        ox_code = np.select(
+            [oxygen < ox_t['low'], oxygen < ox_t['concerning'], oxygen < ox_t['normal']],
+            [DANGER, WARNING, CAUTION], default=NORMAL)
+        temp_code = np.select(
+            [temp > temp_t['high'], temp > temp_t['elevated'], temp > temp_t['normal_high'], temp < temp_t['low']],
+            [DANGER, WARNING, CAUTION, WARNING], default=NORMAL)
+        
+        statuses['hr'] = hr_code
+        statuses['bp'] = bp_code
+        statuses['ox'] = ox_code
+        statuses['temp'] = temp_code
+        statuses['overall'] = np.maximum.reduce([hr_code, bp_code, ox_code, temp_code])
+        
+        return statuses
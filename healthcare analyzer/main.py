@@ -1,20 +1,320 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import datetime
+import sys
+import time
 import sqlite3
 from tkcalendar import DateEntry
 import matplotlib.dates as mdates
+import numpy as np
 import webbrowser
+import queue
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 # Import our modules
 from database_setup import create_database
 from database_manager import DatabaseManager
-from health_analyzer import HealthAnalyzer
-from theme_manager import ThemeManager
+from health_analyzer import HealthAnalyzer, DANGER, metrics_array
+from theme_manager import ThemeManager, CARD_FRAME, CARD_LABEL, CARD_CHECKBUTTON, PRIMARY_BUTTON
 from visual_components import VisualComponents
-from dashboard_widgets import HealthMetricCard, UserInfoPanel, HealthStatusPanel
+from dashboard_widgets import HealthMetricCard, UserInfoPanel, HealthStatusPanel, VirtualTreeview, GaugeCanvas, GaugeSpec
+
+# Treeview columns as (column, heading, width, anchor)
+_CONDITION_COLS = (
+    ("condition", "Potential Condition", 200, "w"),
+    ("confidence", "Confidence", 100, "center")
+)
+_MED_COLS = (
+    ("medication", "Medication", 150, "w"),
+    ("dosage", "Dosage", 100, "w"),
+    ("frequency", "Frequency", 100, "w"),
+    ("purpose", "Purpose", 150, "w"),
+    ("start_date", "Start Date", 100, "w")
+)
+_DIAGNOSIS_COLS = (
+    ("condition", "Condition", 200, "w"),
+    ("diagnosed_date", "Diagnosed Date", 100, "w"),
+    ("status", "Status", 100, "w"),
+    ("severity", "Severity", 100, "w")
+)
+
+# Days covered by each time range / analysis period choice
+_PERIOD_DAYS = MappingProxyType({
+    "1 Day": 1,
+    "3 Days": 3,
+    "1 Week": 7,
+    "2 Weeks": 14,
+    "1 Month": 30
+})
+
+# Mock medication and condition data - in a real app, this would come from the database
+_MEDICATIONS = (
+    {
+        "id": 1,
+        "name": "Lisinopril",
+        "dosage": "10mg",
+        "frequency": "Once daily",
+        "purpose": "Blood pressure control",
+        "start_date": "2023-01-15",
+        "end_date": None,
+        "prescriber": "Dr. Sarah Johnson",
+        "notes": "Take in the morning with food",
+        "side_effects": "Dry cough, dizziness, headache",
+        "interactions": "NSAIDs may reduce effectiveness"
+    },
+    {
+        "id": 2,
+        "name": "Metformin",
+        "dosage": "500mg",
+        "frequency": "Twice daily",
+        "purpose": "Diabetes management",
+        "start_date": "2023-02-10",
+        "end_date": None,
+        "prescriber": "Dr. Michael Chen",
+        "notes": "Take with meals to reduce GI side effects",
+        "side_effects": "Nausea, diarrhea, stomach upset",
+        "interactions": "Alcohol may increase risk of lactic acidosis"
+    },
+    {
+        "id": 3,
+        "name": "Atorvastatin",
+        "dosage": "20mg",
+        "frequency": "Once daily",
+        "purpose": "Cholesterol management",
+        "start_date": "2023-03-05",
+        "end_date": None,
+        "prescriber": "Dr. Sarah Johnson",
+        "notes": "Take in the evening",
+        "side_effects": "Muscle pain, liver enzyme elevation",
+        "interactions": "Grapefruit juice may increase side effects"
+    }
+)
+
+# Tree rows as (values, tags) pairs
+_MED_ROWS = tuple(
+    ((med["name"], med["dosage"], med["frequency"], med["purpose"], med["start_date"]), (str(med["id"]),))
+    for med in _MEDICATIONS
+)
+
+_MED_DETAILS = MappingProxyType({
+    "Lisinopril": MappingProxyType({
+        "name": "Lisinopril",
+        "class": "ACE Inhibitor",
+        "dosage": "10mg",
+        "frequency": "Once daily",
+        "purpose": "Blood pressure control",
+        "start_date": "2023-01-15",
+        "prescriber": "Dr. Sarah Johnson",
+        "notes": "Take in the morning with food",
+        "side_effects": "Dry cough, dizziness, headache",
+        "interactions": "NSAIDs may reduce effectiveness",
+        "monitoring": "Regular blood pressure checks, kidney function tests"
+    }),
+    "Metformin": MappingProxyType({
+        "name": "Metformin",
+        "class": "Biguanide",
+        "dosage": "500mg",
+        "frequency": "Twice daily",
+        "purpose": "Diabetes management",
+        "start_date": "2023-02-10",
+        "prescriber": "Dr. Michael Chen",
+        "notes": "Take with meals to reduce GI side effects",
+        "side_effects": "Nausea, diarrhea, stomach upset",
+        "interactions": "Alcohol may increase risk of lactic acidosis",
+        "monitoring": "Regular HbA1c tests, kidney function"
+    }),
+    "Atorvastatin": MappingProxyType({
+        "name": "Atorvastatin",
+        "class": "Statin",
+        "dosage": "20mg",
+        "frequency": "Once daily",
+        "purpose": "Cholesterol management",
+        "start_date": "2023-03-05",
+        "prescriber": "Dr. Sarah Johnson",
+        "notes": "Take in the evening",
+        "side_effects": "Muscle pain, liver enzyme elevation",
+        "interactions": "Grapefruit juice may increase side effects",
+        "monitoring": "Regular lipid panel, liver function tests"
+    })
+})
+
+def _medication_segments(details):
+    """Render a medication's details as rich text segments"""
+    return (
+        ("heading", f"{details['name']} ({details['class']})\n\n"),
+        ("normal", f"Dosage: {details['dosage']} {details['frequency']}\n"),
+        ("normal", f"Purpose: {details['purpose']}\n"),
+        ("normal", f"Prescribed by: {details['prescriber']} on {details['start_date']}\n\n"),
+        ("subheading", "Instructions:\n"),
+        ("normal", f"{details['notes']}\n\n"),
+        ("subheading", "Potential Side Effects:\n"),
+        ("normal", f"{details['side_effects']}\n\n"),
+        ("subheading", "Drug Interactions:\n"),
+        ("warning", f"{details['interactions']}\n\n"),
+        ("subheading", "Monitoring Required:\n"),
+        ("normal", f"{details['monitoring']}\n")
+    )
+
+# Detail panels pre-rendered once per medication
+_MED_SEGMENTS = MappingProxyType({
+    sys.intern(name): _medication_segments(details) for name, details in _MED_DETAILS.items()
+})
+
+_MED_HISTORY = (
+    ("heading", "Medication History\n\n"),
+    ("date", "2023-01-15: "),
+    ("normal", "Started Lisinopril 10mg daily for hypertension\n\n"),
+    ("date", "2023-02-10: "),
+    ("normal", "Started Metformin 500mg twice daily for diabetes\n\n"),
+    ("date", "2023-03-05: "),
+    ("normal", "Started Atorvastatin 20mg daily for high cholesterol\n\n"),
+    ("date", "2023-04-20: "),
+    ("normal", "Lisinopril dosage adjusted from 5mg to 10mg due to inadequate BP control\n\n")
+)
+
+_CONDITIONS = (
+    {
+        "id": 1,
+        "name": "Hypertension",
+        "diagnosed_date": "2022-11-10",
+        "status": "Active",
+        "severity": "Moderate",
+        "description": "Essential hypertension with systolic readings consistently above 140 mmHg",
+        "treating_physician": "Dr. Sarah Johnson",
+        "notes": "Family history of hypertension. Patient advised on lifestyle modifications."
+    },
+    {
+        "id": 2,
+        "name": "Type 2 Diabetes",
+        "diagnosed_date": "2022-12-05",
+        "status": "Active",
+        "severity": "Mild",
+        "description": "Type 2 diabetes mellitus with HbA1c of 7.2%",
+        "treating_physician": "Dr. Michael Chen",
+        "notes": "Currently managed with oral medication and diet. Regular monitoring required."
+    },
+    {
+        "id": 3,
+        "name": "Hyperlipidemia",
+        "diagnosed_date": "2023-01-20",
+        "status": "Active",
+        "severity": "Mild",
+        "description": "Elevated LDL cholesterol levels",
+        "treating_physician": "Dr. Sarah Johnson",
+        "notes": "Dietary changes implemented with statin therapy."
+    }
+)
+
+_CONDITION_ROWS = tuple(
+    ((condition["name"], condition["diagnosed_date"], condition["status"], condition["severity"]),
+     (str(condition["id"]),))
+    for condition in _CONDITIONS
+)
+
+_CONDITION_DETAILS = MappingProxyType({
+    "Hypertension": MappingProxyType({
+        "name": "Hypertension",
+        "diagnosed_date": "2022-11-10",
+        "status": "Active",
+        "severity": "Moderate",
+        "description": "Essential hypertension with systolic readings consistently above 140 mmHg",
+        "treating_physician": "Dr. Sarah Johnson",
+        "notes": "Family history of hypertension. Patient advised on lifestyle modifications.",
+        "risk_factors": "Family history, sedentary lifestyle, high sodium diet",
+        "complications": "Increased risk of heart disease, stroke, kidney damage",
+        "treatment_plan": "Medication (ACE inhibitor), dietary changes, regular exercise, stress management"
+    }),
+    "Type 2 Diabetes": MappingProxyType({
+        "name": "Type 2 Diabetes",
+        "diagnosed_date": "2022-12-05",
+        "status": "Active",
+        "severity": "Mild",
+        "description": "Type 2 diabetes mellitus with HbA1c of 7.2%",
+        "treating_physician": "Dr. Michael Chen",
+        "notes": "Currently managed with oral medication and diet. Regular monitoring required.",
+        "risk_factors": "Family history, obesity, sedentary lifestyle",
+        "complications": "Neuropathy, retinopathy, cardiovascular disease",
+        "treatment_plan": "Metformin, dietary changes, regular exercise, blood glucose monitoring"
+    }),
+    "Hyperlipidemia": MappingProxyType({
+        "name": "Hyperlipidemia",
+        "diagnosed_date": "2023-01-20",
+        "status": "Active",
+        "severity": "Mild",
+        "description": "Elevated LDL cholesterol levels",
+        "treating_physician": "Dr. Sarah Johnson",
+        "notes": "Dietary changes implemented with statin therapy.",
+        "risk_factors": "Diet high in saturated fats, family history, obesity",
+        "complications": "Atherosclerosis, coronary artery disease",
+        "treatment_plan": "Statin therapy, dietary changes, regular exercise, lipid panel monitoring"
+    })
+})
+
+def _condition_segments(details):
+    """Render a condition's details as rich text segments"""
+    return (
+        ("heading", f"{details['name']}\n\n"),
+        ("normal", f"Diagnosed: {details['diagnosed_date']} by {details['treating_physician']}\n"),
+        ("normal", f"Status: {details['status']} | Severity: {details['severity']}\n\n"),
+        ("subheading", "Description:\n"),
+        ("normal", f"{details['description']}\n\n"),
+        ("subheading", "Risk Factors:\n"),
+        ("normal", f"{details['risk_factors']}\n\n"),
+        ("subheading", "Potential Complications:\n"),
+        ("normal", f"{details['complications']}\n\n"),
+        ("subheading", "Treatment Plan:\n"),
+        ("normal", f"{details['treatment_plan']}\n\n"),
+        ("subheading", "Notes:\n"),
+        ("normal", f"{details['notes']}\n")
+    )
+
+# Detail panels pre-rendered once per condition
+_CONDITION_SEGMENTS = MappingProxyType({
+    sys.intern(name): _condition_segments(details) for name, details in _CONDITION_DETAILS.items()
+})
+
+_TREATMENT_HISTORY = (
+    ("heading", "Treatment History\n\n"),
+    ("date", "2022-11-10: "),
+    ("normal", "Diagnosed with hypertension. Started on Lisinopril 5mg daily.\n\n"),
+    ("date", "2022-12-05: "),
+    ("normal", "Diagnosed with Type 2 Diabetes. Started on Metformin 500mg daily.\n\n"),
+    ("date", "2023-01-20: "),
+    ("normal", "Diagnosed with hyperlipidemia. Started on Atorvastatin 20mg daily.\n\n"),
+    ("date", "2023-04-20: "),
+    ("normal", "Follow-up for hypertension. BP still elevated. Lisinopril increased to 10mg daily.\n\n")
+)
+
+# Recommended action runs per predicted condition, in display order
+_CONDITION_ACTIONS = MappingProxyType({
+    "Hypertension Risk": (
+        ("important", "• Monitor blood pressure regularly\n"),
+        ("normal", "• Consider reducing sodium intake\n"),
+        ("normal", "• Increase physical activity\n")
+    ),
+    "Tachycardia Tendency": (
+        ("important", "• Monitor heart rate during activity\n"),
+        ("normal", "• Consider stress reduction techniques\n"),
+        ("normal", "• Limit caffeine and stimulants\n")
+    ),
+    "Respiratory Concern": (
+        ("important", "• Monitor oxygen levels closely\n"),
+        ("normal", "• Consider respiratory assessment\n")
+    ),
+    "Recurring Fever": (
+        ("important", "• Monitor temperature regularly\n"),
+        ("normal", "• Consider evaluation for infection\n")
+    )
+})
+_DEFAULT_ACTIONS = (
+    ("heading", "Recommended Actions\n\n"),
+    ("normal", "• Continue regular health monitoring\n"),
+    ("normal", "• Maintain healthy lifestyle habits\n"),
+    ("normal", "• Schedule routine check-ups\n")
+)
 
 class HealthMonitorApp:
     def __init__(self, root):
@@ -29,10 +329,19 @@ class HealthMonitorApp:
         # Set up matplotlib styling
         VisualComponents.setup_matplotlib_style()
         
+        # Named fonts shared by the tab labels and text tags
+        self._font_heading = font.Font(family="Arial", size=12, weight="bold")
+        self._font_sub = font.Font(family="Arial", size=10, weight="bold")
+        self._font_normal = font.Font(family="Arial", size=10)
+        
         # Initialize database and analyzer
         try:
             self.db_manager = DatabaseManager()
             self.health_analyzer = HealthAnalyzer()
+            # Single worker so dashboard analysis runs off the Tk thread in order; finished
+            # futures come back through a queue that the Tk thread polls
+            self._pool = ThreadPoolExecutor(max_workers=1)
+            self._results = queue.Queue()
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to connect to database: {e}")
             root.destroy()
@@ -43,24 +352,24 @@ class HealthMonitorApp:
         self.header_frame.pack(fill=tk.X, padx=0, pady=0)
         
         # App title
-        header_content = ttk.Frame(self.header_frame, style="Card.TFrame")
+        header_content = ttk.Frame(self.header_frame, style=CARD_FRAME)
         header_content.pack(fill=tk.X, padx=0, pady=0)
         
-        title_frame = ttk.Frame(header_content, style="Card.TFrame")
+        title_frame = ttk.Frame(header_content, style=CARD_FRAME)
         title_frame.pack(side=tk.LEFT, padx=15, pady=10)
         
-        app_icon_label = ttk.Label(title_frame, text="🩺", style="Card.TLabel", font=("Arial", 22))
+        app_icon_label = ttk.Label(title_frame, text="🩺", style=CARD_LABEL, font=("Arial", 22))
         app_icon_label.pack(side=tk.LEFT, padx=(0, 10))
         
         app_title = ttk.Label(title_frame, text="Advanced Health Monitoring System", 
-                              style="Card.TLabel", font=("Arial", 18, "bold"))
+                              style=CARD_LABEL, font=("Arial", 18, "bold"))
         app_title.pack(side=tk.LEFT)
         
         # User selection in header
-        user_frame = ttk.Frame(header_content, style="Card.TFrame")
+        user_frame = ttk.Frame(header_content, style=CARD_FRAME)
         user_frame.pack(side=tk.RIGHT, padx=15, pady=10)
         
-        ttk.Label(user_frame, text="Select User:", style="Card.TLabel").pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(user_frame, text="Select User:", style=CARD_LABEL).pack(side=tk.LEFT, padx=(0, 10))
         self.user_var = tk.StringVar()
         self.user_dropdown = ttk.Combobox(user_frame, textvariable=self.user_var, state="readonly", width=25)
         self.user_dropdown.pack(side=tk.LEFT, padx=5)
@@ -107,35 +416,55 @@ class HealthMonitorApp:
         self.setup_medical_history_tab()
         
         # Create footer with status bar
-        self.footer_frame = ttk.Frame(root, style="Card.TFrame")
+        self.footer_frame = ttk.Frame(root, style=CARD_FRAME)
         self.footer_frame.pack(fill=tk.X, side=tk.BOTTOM, pady=(5, 0))
         
         # Status message on the left
-        self.status_message = ttk.Label(self.footer_frame, text="Ready", style="Card.TLabel")
+        self.status_message = ttk.Label(self.footer_frame, text="Ready", style=CARD_LABEL)
         self.status_message.pack(side=tk.LEFT, padx=10, pady=5)
         
         # Clock on the right
-        self.clock_label = ttk.Label(self.footer_frame, text="", style="Card.TLabel")
+        self.clock_label = ttk.Label(self.footer_frame, text="", style=CARD_LABEL)
         self.clock_label.pack(side=tk.RIGHT, padx=10, pady=5)
         self.update_clock()
         
         # Help link in the middle
         help_link = ttk.Label(self.footer_frame, text="Help & Resources", 
-                             style="Card.TLabel", foreground=ThemeManager.COLORS['secondary'],
+                             style=CARD_LABEL, foreground=ThemeManager.COLORS['secondary'],
                              cursor="hand2")
         help_link.pack(side=tk.RIGHT, padx=20, pady=5)
         help_link.bind("<Button-1>", lambda e: self.open_help())
         
         # Variables for tracking
         self.current_user_id = None
-        self.health_cards = {}
+        self._users = []
         self.metrics_frames = []
         
-        # Load users into the dropdown
+        # Last dashboard reading and user info shown, to skip redundant redraws
+        self._last_health_key = None
+        self._shown_user_info = None
+        self._filled_cards = set()
+        self._last_error_time = 0
+        self._poll_job = None
+        self._pending_refresh = {}
+        
+        # Refresh functions per tab; tabs marked dirty refresh when next shown
+        self._tab_updates = {
+            str(self.dashboard_tab): self.update_dashboard_data,
+            str(self.trends_tab): self.update_trends,
+            str(self.analysis_tab): self.run_analysis,
+            str(self.medications_tab): self.update_medications,
+            str(self.medical_history_tab): self.update_medical_history
+        }
+        self._dirty = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._flush_dirty)
+        
+        # Hand finished background work back to the Tk thread, then load users into the dropdown
+        self.root.after(50, self._poll_results)
         self.load_users()
         
         # Update data periodically (every 10 seconds)
-        self.root.after(10000, self.update_data)
+        self._poll_job = self.root.after(10000, self.update_data)
     
     def update_clock(self):
         """Update the clock in the footer"""
@@ -163,14 +492,14 @@ class HealthMonitorApp:
         main_dashboard.columnconfigure(1, weight=1)
         
         # Top left: User info panel
-        user_frame = ttk.Frame(main_dashboard, style="Card.TFrame")
+        user_frame = ttk.Frame(main_dashboard, style=CARD_FRAME)
         user_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
         
         self.user_panel = UserInfoPanel(user_frame)
         self.user_panel.frame.pack(fill=tk.BOTH, expand=True)
         
         # Top right: Health status and alerts
-        status_frame = ttk.Frame(main_dashboard, style="Card.TFrame")
+        status_frame = ttk.Frame(main_dashboard, style=CARD_FRAME)
         status_frame.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
         
         self.health_status_panel = HealthStatusPanel(status_frame)
@@ -222,27 +551,26 @@ class HealthMonitorApp:
     def setup_trends_tab(self):
         """Set up the trends tab with historical data visualization"""
         # Top frame for controls
-        top_frame = ttk.Frame(self.trends_tab, style="Card.TFrame")
+        top_frame = ttk.Frame(self.trends_tab, style=CARD_FRAME)
         top_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # User selection
-        user_ctrl_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        user_ctrl_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         user_ctrl_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Label(user_ctrl_frame, text="Select User:", style="Card.TLabel", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 10))
-        self.trends_user_var = tk.StringVar()
-        self.trends_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.trends_user_var, state="readonly", width=25)
+        ttk.Label(user_ctrl_frame, text="Select User:", style=CARD_LABEL, font=self._font_sub).pack(side=tk.LEFT, padx=(0, 10))
+        self.trends_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.user_var, state="readonly", width=25)
         self.trends_user_dropdown.pack(side=tk.LEFT, padx=5)
         self.trends_user_dropdown.bind("<<ComboboxSelected>>", self.on_trends_user_selected)
         
         # Separator
-        ttk.Label(top_frame, text="|", style="Card.TLabel").pack(side=tk.LEFT, padx=10)
+        ttk.Label(top_frame, text="|", style=CARD_LABEL).pack(side=tk.LEFT, padx=10)
         
         # Time range selection
-        time_ctrl_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        time_ctrl_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         time_ctrl_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Label(time_ctrl_frame, text="Time Range:", style="Card.TLabel", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(time_ctrl_frame, text="Time Range:", style=CARD_LABEL, font=self._font_sub).pack(side=tk.LEFT, padx=(0, 10))
         self.time_range_var = tk.StringVar(value="1 Day")
         time_ranges = ["1 Day", "3 Days", "1 Week", "2 Weeks", "1 Month", "Custom"]
         self.time_range_dropdown = ttk.Combobox(time_ctrl_frame, textvariable=self.time_range_var, 
@@ -251,63 +579,64 @@ class HealthMonitorApp:
         self.time_range_dropdown.bind("<<ComboboxSelected>>", self.on_time_range_selected)
         
         # Custom date range frame (initially hidden)
-        self.custom_date_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        self.custom_date_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         
-        date_selection = ttk.Frame(self.custom_date_frame, style="Card.TFrame")
+        date_selection = ttk.Frame(self.custom_date_frame, style=CARD_FRAME)
         date_selection.pack(side=tk.LEFT, fill=tk.Y, padx=10)
         
-        ttk.Label(date_selection, text="From:", style="Card.TLabel").pack(side=tk.LEFT, padx=(20, 5))
+        ttk.Label(date_selection, text="From:", style=CARD_LABEL).pack(side=tk.LEFT, padx=(20, 5))
         self.start_date = DateEntry(date_selection, width=12, background=ThemeManager.COLORS['primary'],
                                    foreground='white', borderwidth=2, date_pattern='yyyy-mm-dd')
         self.start_date.pack(side=tk.LEFT, padx=5)
         
-        ttk.Label(date_selection, text="To:", style="Card.TLabel").pack(side=tk.LEFT, padx=(10, 5))
+        ttk.Label(date_selection, text="To:", style=CARD_LABEL).pack(side=tk.LEFT, padx=(10, 5))
         self.end_date = DateEntry(date_selection, width=12, background=ThemeManager.COLORS['primary'],
                                  foreground='white', borderwidth=2, date_pattern='yyyy-mm-dd')
         self.end_date.pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(self.custom_date_frame, text="Apply Custom Range", style="Primary.TButton",
+        ttk.Button(self.custom_date_frame, text="Apply Custom Range", style=PRIMARY_BUTTON,
                   command=self.update_trends).pack(side=tk.LEFT, padx=(20, 5), pady=10)
         
         # Update button
-        update_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        update_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         update_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Button(update_frame, text="Update Chart", style="Primary.TButton",
+        ttk.Button(update_frame, text="Update Chart", style=PRIMARY_BUTTON,
                   command=self.update_trends).pack(side=tk.RIGHT)
         
         # Data visualization controls
-        viz_control_frame = ttk.Frame(self.trends_tab, style="Card.TFrame")
+        viz_control_frame = ttk.Frame(self.trends_tab, style=CARD_FRAME)
         viz_control_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
         
         # Show/hide reference ranges checkbox
         self.show_ref_ranges = tk.BooleanVar(value=True)
         show_ref_cb = ttk.Checkbutton(viz_control_frame, text="Show Reference Ranges", 
                                      variable=self.show_ref_ranges, command=self.update_trends,
-                                     style="Card.TCheckbutton")
+                                     style=CARD_CHECKBUTTON)
         show_ref_cb.pack(side=tk.LEFT, padx=10, pady=5)
         
         # Show data points checkbox
         self.show_data_points = tk.BooleanVar(value=True)
         show_points_cb = ttk.Checkbutton(viz_control_frame, text="Show Data Points", 
                                         variable=self.show_data_points, command=self.update_trends,
-                                        style="Card.TCheckbutton")
+                                        style=CARD_CHECKBUTTON)
         show_points_cb.pack(side=tk.LEFT, padx=10, pady=5)
         
         # Show fill areas checkbox
         self.show_fill = tk.BooleanVar(value=True)
         show_fill_cb = ttk.Checkbutton(viz_control_frame, text="Show Fill Areas", 
                                       variable=self.show_fill, command=self.update_trends,
-                                      style="Card.TCheckbutton")
+                                      style=CARD_CHECKBUTTON)
         show_fill_cb.pack(side=tk.LEFT, padx=10, pady=5)
         
         # Main content frame for charts
-        self.trends_content_frame = ttk.Frame(self.trends_tab, style="Card.TFrame")
+        self.trends_content_frame = ttk.Frame(self.trends_tab, style=CARD_FRAME)
         self.trends_content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create figure for matplotlib
         self.fig, self.axes = plt.subplots(2, 2, figsize=(10, 8))
-        VisualComponents.setup_charts(self.fig, self.axes)
+        self.chart_artists = VisualComponents.setup_charts(self.fig, self.axes)
+        self._charts_laid_out = False
         
         # Create canvas for matplotlib figure
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.trends_content_frame)
@@ -322,28 +651,32 @@ class HealthMonitorApp:
     
     def setup_analysis_tab(self):
         """Set up the analysis tab with health predictions and insights"""
+        # Theme colors and fonts used below
+        colors = ThemeManager.COLORS
+        card, primary, secondary, danger = colors['card'], colors['primary'], colors['secondary'], colors['danger']
+        heading_font, bold_font, normal_font = self._font_heading, self._font_sub, self._font_normal
+        
         # Top frame for controls
-        top_frame = ttk.Frame(self.analysis_tab, style="Card.TFrame")
+        top_frame = ttk.Frame(self.analysis_tab, style=CARD_FRAME)
         top_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # User selection
-        user_ctrl_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        user_ctrl_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         user_ctrl_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Label(user_ctrl_frame, text="Select User:", style="Card.TLabel", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 10))
-        self.analysis_user_var = tk.StringVar()
-        self.analysis_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.analysis_user_var, state="readonly", width=25)
+        ttk.Label(user_ctrl_frame, text="Select User:", style=CARD_LABEL, font=bold_font).pack(side=tk.LEFT, padx=(0, 10))
+        self.analysis_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.user_var, state="readonly", width=25)
         self.analysis_user_dropdown.pack(side=tk.LEFT, padx=5)
         self.analysis_user_dropdown.bind("<<ComboboxSelected>>", self.on_analysis_user_selected)
         
         # Separator
-        ttk.Label(top_frame, text="|", style="Card.TLabel").pack(side=tk.LEFT, padx=10)
+        ttk.Label(top_frame, text="|", style=CARD_LABEL).pack(side=tk.LEFT, padx=10)
         
         # Analysis period selection
-        period_ctrl_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        period_ctrl_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         period_ctrl_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Label(period_ctrl_frame, text="Analysis Period:", style="Card.TLabel", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(period_ctrl_frame, text="Analysis Period:", style=CARD_LABEL, font=bold_font).pack(side=tk.LEFT, padx=(0, 10))
         self.analysis_period_var = tk.StringVar(value="1 Week")
         analysis_periods = ["1 Day", "3 Days", "1 Week", "2 Weeks", "1 Month"]
         self.analysis_period_dropdown = ttk.Combobox(period_ctrl_frame, textvariable=self.analysis_period_var, 
@@ -351,10 +684,10 @@ class HealthMonitorApp:
         self.analysis_period_dropdown.pack(side=tk.LEFT, padx=5)
         
         # Update button
-        update_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        update_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         update_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Button(update_frame, text="Run Analysis", style="Primary.TButton",
+        ttk.Button(update_frame, text="Run Analysis", style=PRIMARY_BUTTON,
                   command=self.run_analysis).pack(side=tk.RIGHT)
                   
         # Main content area - divided into two sections
@@ -366,149 +699,89 @@ class HealthMonitorApp:
         left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
         # Health summary card
-        summary_frame = ttk.LabelFrame(left_panel, text="Health Summary", style="Card.TFrame")
+        summary_frame = ttk.LabelFrame(left_panel, text="Health Summary", style=CARD_FRAME)
         summary_frame.pack(fill=tk.BOTH, expand=False, pady=5)
         
-        summary_content = ttk.Frame(summary_frame, style="Card.TFrame")
-        summary_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.summary_text = tk.Text(summary_content, wrap=tk.WORD, height=10, width=40, 
-                                   bg=ThemeManager.COLORS['card'], bd=0, highlightthickness=0)
-        self.summary_text.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        
-        # Add scrollbar to summary text
-        summary_scroll = ttk.Scrollbar(summary_content, orient=tk.VERTICAL, command=self.summary_text.yview)
-        summary_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.summary_text.config(yscrollcommand=summary_scroll.set)
-        self.summary_text.config(state=tk.DISABLED)
-        
-        # Configure text tags for formatting
-        self.summary_text.tag_configure("heading", font=("Arial", 12, "bold"), 
-                                      foreground=ThemeManager.COLORS['primary'])
-        self.summary_text.tag_configure("subheading", font=("Arial", 10, "bold"), 
-                                      foreground=ThemeManager.COLORS['secondary'])
-        self.summary_text.tag_configure("normal", font=("Arial", 10))
-        self.summary_text.tag_configure("alert", font=("Arial", 10), 
-                                      foreground=ThemeManager.COLORS['danger'])
+        self.summary_text = VisualComponents.create_scrolled_text(summary_frame, height=10, width=40, tags={
+            "heading": {"font": heading_font, "foreground": primary},
+            "subheading": {"font": bold_font, "foreground": secondary},
+            "normal": {"font": normal_font},
+            "alert": {"font": normal_font, "foreground": danger}
+        })
                                       
         # Detailed Metrics Card
-        metrics_frame = ttk.LabelFrame(left_panel, text="Health Metrics Analysis", style="Card.TFrame")
+        metrics_frame = ttk.LabelFrame(left_panel, text="Health Metrics Analysis", style=CARD_FRAME)
         metrics_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Create a canvas with scrollbar for metrics
-        metrics_canvas = tk.Canvas(metrics_frame, bd=0, highlightthickness=0, bg=ThemeManager.COLORS['card'])
+        metrics_canvas = tk.Canvas(metrics_frame, bd=0, highlightthickness=0, bg=card)
         metrics_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        metrics_scrollbar = ttk.Scrollbar(metrics_frame, orient=tk.VERTICAL, command=metrics_canvas.yview)
+        metrics_scrollbar = ttk.Scrollbar(metrics_frame, orient=tk.VERTICAL)
         metrics_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        metrics_canvas.configure(yscrollcommand=metrics_scrollbar.set)
-        metrics_canvas.bind('<Configure>', lambda e: metrics_canvas.configure(scrollregion=metrics_canvas.bbox("all")))
-        
-        # Create interior frame for metrics
-        metrics_interior = ttk.Frame(metrics_canvas, style="Card.TFrame")
-        metrics_canvas.create_window((0, 0), window=metrics_interior, anchor="nw", width=metrics_canvas.winfo_reqwidth())
-        
-        # Will add gauge widgets here dynamically
-        self.metrics_container = metrics_interior
+        # Gauges are drawn as canvas items, only while in view
+        self.metrics_gauges = GaugeCanvas(metrics_canvas, metrics_scrollbar)
         
         # Right panel: Potential conditions
         right_panel = ttk.Frame(main_content, style="TFrame")
         right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
         # Potential conditions frame
-        conditions_frame = ttk.LabelFrame(right_panel, text="Potential Health Conditions", style="Card.TFrame")
+        conditions_frame = ttk.LabelFrame(right_panel, text="Potential Health Conditions", style=CARD_FRAME)
         conditions_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Create a treeview for potential conditions with better styling
-        columns = ("condition", "confidence")
-        self.conditions_tree = ttk.Treeview(conditions_frame, columns=columns, show="headings", 
-                                           style="Card.Treeview", height=10)
-                                           
-        # Define headings
-        self.conditions_tree.heading("condition", text="Potential Condition")
-        self.conditions_tree.heading("confidence", text="Confidence")
-        
-        # Define columns
-        self.conditions_tree.column("condition", width=200)
-        self.conditions_tree.column("confidence", width=100, anchor="center")
-        
-        # Pack with scrollbar
-        tree_container = ttk.Frame(conditions_frame, style="Card.TFrame")
-        tree_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.conditions_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Add scrollbar to treeview
-        tree_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.conditions_tree.yview)
-        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.conditions_tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.conditions_tree, tree_scrollbar = VisualComponents.create_scrolled_tree(conditions_frame, _CONDITION_COLS)
+        self.conditions_view = VirtualTreeview(self.conditions_tree, tree_scrollbar)
         
         # Bottom frame for condition details
-        details_frame = ttk.LabelFrame(right_panel, text="Condition Details", style="Card.TFrame")
+        details_frame = ttk.LabelFrame(right_panel, text="Condition Details", style=CARD_FRAME)
         details_frame.pack(fill=tk.X, expand=False, pady=5)
         
-        details_content = ttk.Frame(details_frame, style="Card.TFrame")
-        details_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.condition_details = tk.Text(details_content, wrap=tk.WORD, height=5,
-                                       bg=ThemeManager.COLORS['card'], bd=0, highlightthickness=0)
-        self.condition_details.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        
-        # Add scrollbar to condition details
-        details_scroll = ttk.Scrollbar(details_content, orient=tk.VERTICAL, command=self.condition_details.yview)
-        details_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.condition_details.config(yscrollcommand=details_scroll.set)
-        self.condition_details.config(state=tk.DISABLED)
-        
-        # Configure text tags for formatting
-        self.condition_details.tag_configure("heading", font=("Arial", 12, "bold"), 
-                                          foreground=ThemeManager.COLORS['primary'])
-        self.condition_details.tag_configure("normal", font=("Arial", 10))
+        self.condition_details = VisualComponents.create_scrolled_text(details_frame, height=5, tags={
+            "heading": {"font": heading_font, "foreground": primary},
+            "normal": {"font": normal_font}
+        })
         
         # Bind selection event to show details
         self.conditions_tree.bind("<<TreeviewSelect>>", self.show_condition_details)
         
         # Action recommendations frame
-        actions_frame = ttk.LabelFrame(right_panel, text="Recommended Actions", style="Card.TFrame")
+        actions_frame = ttk.LabelFrame(right_panel, text="Recommended Actions", style=CARD_FRAME)
         actions_frame.pack(fill=tk.BOTH, expand=False, pady=5)
         
-        actions_content = ttk.Frame(actions_frame, style="Card.TFrame")
-        actions_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.actions_text = tk.Text(actions_content, wrap=tk.WORD, height=5,
-                                  bg=ThemeManager.COLORS['card'], bd=0, highlightthickness=0)
-        self.actions_text.pack(fill=tk.BOTH, expand=True)
-        self.actions_text.config(state=tk.DISABLED)
-        
-        # Configure text tags for formatting
-        self.actions_text.tag_configure("heading", font=("Arial", 12, "bold"), 
-                                      foreground=ThemeManager.COLORS['primary'])
-        self.actions_text.tag_configure("important", font=("Arial", 10, "bold"),
-                                      foreground=ThemeManager.COLORS['danger'])
-        self.actions_text.tag_configure("normal", font=("Arial", 10))
+        self.actions_text = VisualComponents.create_scrolled_text(actions_frame, height=5, scroll=False, tags={
+            "heading": {"font": heading_font, "foreground": primary},
+            "important": {"font": bold_font, "foreground": danger},
+            "normal": {"font": normal_font}
+        })
     
     def setup_medications_tab(self):
         """Set up the medications tab with current prescriptions and history"""
+        # Theme colors and fonts used below
+        colors = ThemeManager.COLORS
+        primary, secondary, warning = colors['primary'], colors['secondary'], colors['warning']
+        heading_font, bold_font, normal_font = self._font_heading, self._font_sub, self._font_normal
+        
         # Top frame for controls
-        top_frame = ttk.Frame(self.medications_tab, style="Card.TFrame")
+        top_frame = ttk.Frame(self.medications_tab, style=CARD_FRAME)
         top_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # User selection
-        user_ctrl_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        user_ctrl_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         user_ctrl_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Label(user_ctrl_frame, text="Select User:", style="Card.TLabel", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 10))
-        self.meds_user_var = tk.StringVar()
-        self.meds_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.meds_user_var, state="readonly", width=25)
+        ttk.Label(user_ctrl_frame, text="Select User:", style=CARD_LABEL, font=bold_font).pack(side=tk.LEFT, padx=(0, 10))
+        self.meds_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.user_var, state="readonly", width=25)
         self.meds_user_dropdown.pack(side=tk.LEFT, padx=5)
         self.meds_user_dropdown.bind("<<ComboboxSelected>>", self.on_meds_user_selected)
         
         # Update button
-        update_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        update_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         update_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Button(update_frame, text="Refresh Medications", style="Primary.TButton",
+        ttk.Button(update_frame, text="Refresh Medications", style=PRIMARY_BUTTON,
                   command=self.update_medications).pack(side=tk.RIGHT)
         
         # Main content area - divided into two sections
@@ -523,38 +796,12 @@ class HealthMonitorApp:
         # Removed incomplete line causing syntax error
         
         # Current medications frame
-        current_meds_frame = ttk.LabelFrame(left_panel, text="Current Medications", style="Card.TFrame")
+        current_meds_frame = ttk.LabelFrame(left_panel, text="Current Medications", style=CARD_FRAME)
         current_meds_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Create a treeview for current medications
-        columns = ("medication", "dosage", "frequency", "purpose", "start_date")
-        self.current_meds_tree = ttk.Treeview(current_meds_frame, columns=columns, show="headings", 
-                                             style="Card.Treeview", height=10)
-                                             
-        # Define headings
-        self.current_meds_tree.heading("medication", text="Medication")
-        self.current_meds_tree.heading("dosage", text="Dosage")
-        self.current_meds_tree.heading("frequency", text="Frequency")
-        self.current_meds_tree.heading("purpose", text="Purpose")
-        self.current_meds_tree.heading("start_date", text="Start Date")
-        
-        # Define columns
-        self.current_meds_tree.column("medication", width=150)
-        self.current_meds_tree.column("dosage", width=100)
-        self.current_meds_tree.column("frequency", width=100)
-        self.current_meds_tree.column("purpose", width=150)
-        self.current_meds_tree.column("start_date", width=100)
-        
-        # Pack with scrollbar
-        meds_container = ttk.Frame(current_meds_frame, style="Card.TFrame")
-        meds_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.current_meds_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Add scrollbar to treeview
-        meds_scrollbar = ttk.Scrollbar(meds_container, orient=tk.VERTICAL, command=self.current_meds_tree.yview)
-        meds_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.current_meds_tree.configure(yscrollcommand=meds_scrollbar.set)
+        self.current_meds_tree, meds_scrollbar = VisualComponents.create_scrolled_tree(current_meds_frame, _MED_COLS)
+        self.current_meds_view = VirtualTreeview(self.current_meds_tree, meds_scrollbar)
         
         # Bind selection event
         self.current_meds_tree.bind("<<TreeviewSelect>>", self.show_medication_details)
@@ -564,76 +811,51 @@ class HealthMonitorApp:
         right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
         # Medication details frame
-        details_frame = ttk.LabelFrame(right_panel, text="Medication Details", style="Card.TFrame")
+        details_frame = ttk.LabelFrame(right_panel, text="Medication Details", style=CARD_FRAME)
         details_frame.pack(fill=tk.BOTH, expand=False, pady=5)
         
-        details_content = ttk.Frame(details_frame, style="Card.TFrame")
-        details_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.med_details_text = tk.Text(details_content, wrap=tk.WORD, height=8,
-                                      bg=ThemeManager.COLORS['card'], bd=0, highlightthickness=0)
-        self.med_details_text.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        
-        # Add scrollbar to details text
-        details_scroll = ttk.Scrollbar(details_content, orient=tk.VERTICAL, command=self.med_details_text.yview)
-        details_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.med_details_text.config(yscrollcommand=details_scroll.set)
-        self.med_details_text.config(state=tk.DISABLED)
-        
-        # Configure text tags for formatting
-        self.med_details_text.tag_configure("heading", font=("Arial", 12, "bold"), 
-                                         foreground=ThemeManager.COLORS['primary'])
-        self.med_details_text.tag_configure("subheading", font=("Arial", 10, "bold"), 
-                                         foreground=ThemeManager.COLORS['secondary'])
-        self.med_details_text.tag_configure("normal", font=("Arial", 10))
-        self.med_details_text.tag_configure("warning", font=("Arial", 10, "bold"),
-                                         foreground=ThemeManager.COLORS['warning'])
+        self.med_details_text = VisualComponents.create_scrolled_text(details_frame, height=8, tags={
+            "heading": {"font": heading_font, "foreground": primary},
+            "subheading": {"font": bold_font, "foreground": secondary},
+            "normal": {"font": normal_font},
+            "warning": {"font": bold_font, "foreground": warning}
+        })
         
         # Medication history frame
-        history_frame = ttk.LabelFrame(right_panel, text="Medication History", style="Card.TFrame")
+        history_frame = ttk.LabelFrame(right_panel, text="Medication History", style=CARD_FRAME)
         history_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        history_content = ttk.Frame(history_frame, style="Card.TFrame")
-        history_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.med_history_text = tk.Text(history_content, wrap=tk.WORD, height=10,
-                                      bg=ThemeManager.COLORS['card'], bd=0, highlightthickness=0)
-        self.med_history_text.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        
-        # Add scrollbar to history text
-        history_scroll = ttk.Scrollbar(history_content, orient=tk.VERTICAL, command=self.med_history_text.yview)
-        history_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.med_history_text.config(yscrollcommand=history_scroll.set)
-        self.med_history_text.config(state=tk.DISABLED)
-        
-        # Configure text tags for formatting
-        self.med_history_text.tag_configure("heading", font=("Arial", 12, "bold"), 
-                                         foreground=ThemeManager.COLORS['primary'])
-        self.med_history_text.tag_configure("date", font=("Arial", 10, "bold"), 
-                                         foreground=ThemeManager.COLORS['secondary'])
-        self.med_history_text.tag_configure("normal", font=("Arial", 10))
+        self.med_history_text = VisualComponents.create_scrolled_text(history_frame, height=10, tags={
+            "heading": {"font": heading_font, "foreground": primary},
+            "date": {"font": bold_font, "foreground": secondary},
+            "normal": {"font": normal_font}
+        })
     
     def setup_medical_history_tab(self):
         """Set up the medical history tab with diagnoses and conditions"""
+        # Theme colors and fonts used below
+        colors = ThemeManager.COLORS
+        primary, secondary = colors['primary'], colors['secondary']
+        heading_font, bold_font, normal_font = self._font_heading, self._font_sub, self._font_normal
+        
         # Top frame for controls
-        top_frame = ttk.Frame(self.medical_history_tab, style="Card.TFrame")
+        top_frame = ttk.Frame(self.medical_history_tab, style=CARD_FRAME)
         top_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # User selection
-        user_ctrl_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        user_ctrl_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         user_ctrl_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Label(user_ctrl_frame, text="Select User:", style="Card.TLabel", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 10))
-        self.history_user_var = tk.StringVar()
-        self.history_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.history_user_var, state="readonly", width=25)
+        ttk.Label(user_ctrl_frame, text="Select User:", style=CARD_LABEL, font=bold_font).pack(side=tk.LEFT, padx=(0, 10))
+        self.history_user_dropdown = ttk.Combobox(user_ctrl_frame, textvariable=self.user_var, state="readonly", width=25)
         self.history_user_dropdown.pack(side=tk.LEFT, padx=5)
         self.history_user_dropdown.bind("<<ComboboxSelected>>", self.on_history_user_selected)
         
         # Update button
-        update_frame = ttk.Frame(top_frame, style="Card.TFrame")
+        update_frame = ttk.Frame(top_frame, style=CARD_FRAME)
         update_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10, pady=10)
         
-        ttk.Button(update_frame, text="Refresh History", style="Primary.TButton",
+        ttk.Button(update_frame, text="Refresh History", style=PRIMARY_BUTTON,
                   command=self.update_medical_history).pack(side=tk.RIGHT)
         
         # Main content area - divided into sections
@@ -645,36 +867,12 @@ class HealthMonitorApp:
         left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
         # Diagnoses frame
-        diagnoses_frame = ttk.LabelFrame(left_panel, text="Diagnoses & Conditions", style="Card.TFrame")
+        diagnoses_frame = ttk.LabelFrame(left_panel, text="Diagnoses & Conditions", style=CARD_FRAME)
         diagnoses_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Create a treeview for diagnoses
-        columns = ("condition", "diagnosed_date", "status", "severity")
-        self.diagnoses_tree = ttk.Treeview(diagnoses_frame, columns=columns, show="headings", 
-                                          style="Card.Treeview", height=10)
-                                          
-        # Define headings
-        self.diagnoses_tree.heading("condition", text="Condition")
-        self.diagnoses_tree.heading("diagnosed_date", text="Diagnosed Date")
-        self.diagnoses_tree.heading("status", text="Status")
-        self.diagnoses_tree.heading("severity", text="Severity")
-        
-        # Define columns
-        self.diagnoses_tree.column("condition", width=200)
-        self.diagnoses_tree.column("diagnosed_date", width=100)
-        self.diagnoses_tree.column("status", width=100)
-        self.diagnoses_tree.column("severity", width=100)
-        
-        # Pack with scrollbar
-        diagnoses_container = ttk.Frame(diagnoses_frame, style="Card.TFrame")
-        diagnoses_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.diagnoses_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Add scrollbar to treeview
-        diagnoses_scrollbar = ttk.Scrollbar(diagnoses_container, orient=tk.VERTICAL, command=self.diagnoses_tree.yview)
-        diagnoses_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.diagnoses_tree.configure(yscrollcommand=diagnoses_scrollbar.set)
+        self.diagnoses_tree, diagnoses_scrollbar = VisualComponents.create_scrolled_tree(diagnoses_frame, _DIAGNOSIS_COLS)
+        self.diagnoses_view = VirtualTreeview(self.diagnoses_tree, diagnoses_scrollbar)
         
         # Bind selection event
         self.diagnoses_tree.bind("<<TreeviewSelect>>", self.show_condition_history)
@@ -684,175 +882,144 @@ class HealthMonitorApp:
         right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
         # Condition details frame
-        condition_details_frame = ttk.LabelFrame(right_panel, text="Condition Details", style="Card.TFrame")
+        condition_details_frame = ttk.LabelFrame(right_panel, text="Condition Details", style=CARD_FRAME)
         condition_details_frame.pack(fill=tk.BOTH, expand=False, pady=5)
         
-        condition_details_content = ttk.Frame(condition_details_frame, style="Card.TFrame")
-        condition_details_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.condition_details_text = tk.Text(condition_details_content, wrap=tk.WORD, height=8,
-                                           bg=ThemeManager.COLORS['card'], bd=0, highlightthickness=0)
-        self.condition_details_text.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        
-        # Add scrollbar to details text
-        condition_details_scroll = ttk.Scrollbar(condition_details_content, orient=tk.VERTICAL, 
-                                               command=self.condition_details_text.yview)
-        condition_details_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.condition_details_text.config(yscrollcommand=condition_details_scroll.set)
-        self.condition_details_text.config(state=tk.DISABLED)
-        
-        # Configure text tags for formatting
-        self.condition_details_text.tag_configure("heading", font=("Arial", 12, "bold"), 
-                                              foreground=ThemeManager.COLORS['primary'])
-        self.condition_details_text.tag_configure("subheading", font=("Arial", 10, "bold"), 
-                                              foreground=ThemeManager.COLORS['secondary'])
-        self.condition_details_text.tag_configure("normal", font=("Arial", 10))
+        self.condition_details_text = VisualComponents.create_scrolled_text(condition_details_frame, height=8, tags={
+            "heading": {"font": heading_font, "foreground": primary},
+            "subheading": {"font": bold_font, "foreground": secondary},
+            "normal": {"font": normal_font}
+        })
         
         # Treatment history frame
-        treatment_frame = ttk.LabelFrame(right_panel, text="Treatment History", style="Card.TFrame")
+        treatment_frame = ttk.LabelFrame(right_panel, text="Treatment History", style=CARD_FRAME)
         treatment_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        treatment_content = ttk.Frame(treatment_frame, style="Card.TFrame")
-        treatment_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        self.treatment_history_text = tk.Text(treatment_content, wrap=tk.WORD, height=10,
-                                           bg=ThemeManager.COLORS['card'], bd=0, highlightthickness=0)
-        self.treatment_history_text.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        
-        # Add scrollbar to history text
-        treatment_scroll = ttk.Scrollbar(treatment_content, orient=tk.VERTICAL, command=self.treatment_history_text.yview)
-        treatment_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.treatment_history_text.config(yscrollcommand=treatment_scroll.set)
-        self.treatment_history_text.config(state=tk.DISABLED)
-        
-        # Configure text tags for formatting
-        self.treatment_history_text.tag_configure("heading", font=("Arial", 12, "bold"), 
-                                              foreground=ThemeManager.COLORS['primary'])
-        self.treatment_history_text.tag_configure("date", font=("Arial", 10, "bold"), 
-                                              foreground=ThemeManager.COLORS['secondary'])
-        self.treatment_history_text.tag_configure("normal", font=("Arial", 10))
+        self.treatment_history_text = VisualComponents.create_scrolled_text(treatment_frame, height=10, tags={
+            "heading": {"font": heading_font, "foreground": primary},
+            "date": {"font": bold_font, "foreground": secondary},
+            "normal": {"font": normal_font}
+        })
+    
+    def show_db_error(self, message, error):
+        """Report a database error in the status bar, and in a dialog at most every 5 seconds"""
+        self.status_message.config(text=f"Database error: {str(error)[:50]}...")
+        
+        # Each dialog runs a nested event loop; don't stack them for repeated failures
+        now = time.monotonic()
+        if now - self._last_error_time > 5:
+            self._last_error_time = now
+            messagebox.showerror("Database Error", message)
+    
+    def run_in_background(self, callback, func, *args):
+        """Run func(*args) on the worker thread, then callback(future) on the Tk thread"""
+        future = self._pool.submit(func, *args)
+        # Done callbacks run on the worker thread, which must not call Tk, so only queue the result
+        future.add_done_callback(lambda f: self._results.put((callback, f)))
+    
+    def _poll_results(self):
+        """Pass finished background work to its callback (runs on the Tk thread)"""
+        self.root.after(50, self._poll_results)
+        while True:
+            try:
+                callback, future = self._results.get_nowait()
+            except queue.Empty:
+                return
+            callback(future)
     
     def load_users(self):
-        """Load users into the dropdown menus"""
+        """Load users into the dropdown menus (the queries run on the worker thread)"""
+        self.run_in_background(self._on_users_loaded, self._fetch_users)
+    
+    def _fetch_users(self):
+        """Fetch the user list and the first user's bundle (runs on the worker thread)"""
+        users = self.db_manager.get_user_names()
+        bundle = self.db_manager.get_user_bundle(users[0][0]) if users else None
+        return users, bundle
+    
+    def _on_users_loaded(self, future):
+        """Fill the dropdowns from the result of _fetch_users"""
         try:
-            users = self.db_manager.get_user_names()
+            users, bundle = future.result()
             user_list = [(uid, name) for uid, name in users]
             
             # Update all dropdowns
-            self.user_dropdown['values'] = [name for _, name in user_list]
-            self.trends_user_dropdown['values'] = [name for _, name in user_list]
-            self.analysis_user_dropdown['values'] = [name for _, name in user_list]
-            self.meds_user_dropdown['values'] = [name for _, name in user_list]
-            self.history_user_dropdown['values'] = [name for _, name in user_list]
+            names = [name for _, name in user_list]
+            self.user_dropdown['values'] = names
+            self.trends_user_dropdown['values'] = names
+            self.analysis_user_dropdown['values'] = names
+            self.meds_user_dropdown['values'] = names
+            self.history_user_dropdown['values'] = names
             
-            # Store user IDs for lookup
-            self.user_ids = {name: uid for uid, name in user_list}
+            # Users in dropdown order; a dropdown's current() index is the lookup key,
+            # so users sharing a name stay distinct
+            self._users = user_list
             
             # Select first user by default if available
             if user_list:
                 self.user_var.set(user_list[0][1])
-                self.trends_user_var.set(user_list[0][1])
-                self.analysis_user_var.set(user_list[0][1])
-                self.meds_user_var.set(user_list[0][1])
-                self.history_user_var.set(user_list[0][1])
                 self.current_user_id = user_list[0][0]
                 
-                # Update data for the selected user
-                self.update_dashboard_data()
-                self.update_trends()
-                self.run_analysis()
-                self.update_medications()
-                self.update_medical_history()
+                # Fill the dashboard from the batched fetch; the other tabs
+                # refresh when first shown
+                self._dirty = set(self._tab_updates)
+                self._dirty.discard(str(self.dashboard_tab))
+                self.update_dashboard_data(bundle)
+                self._flush_dirty()
                 
                 self.status_message.config(text=f"Loaded {len(user_list)} users successfully")
             else:
                 self.status_message.config(text="No users found in database")
         except sqlite3.Error as e:
-            self.status_message.config(text=f"Database error: {str(e)[:50]}...")
-            messagebox.showerror("Database Error", f"Failed to load users: {e}")
+            self.show_db_error(f"Failed to load users: {e}", e)
+    
+    def switch_user(self, index):
+        """Make the user at a dropdown index current and refresh only the visible tab"""
+        self.current_user_id = self._users[index][0]
+        
+        # Mark every tab dirty; hidden tabs refresh when they are shown
+        self._dirty = set(self._tab_updates)
+        self._flush_dirty()
+    
+    def _flush_dirty(self, event=None):
+        """Refresh the visible tab if it is marked dirty"""
+        current_tab = self.notebook.select()
+        if current_tab in self._dirty:
+            self._dirty.discard(current_tab)
+            self._tab_updates[current_tab]()
     
     def on_user_selected(self, event):
         """Handle user selection in any dropdown"""
         selected_user = self.user_var.get()
-        self.current_user_id = self.user_ids.get(selected_user)
-        
-        # Update all dropdowns to match
-        self.trends_user_var.set(selected_user)
-        self.analysis_user_var.set(selected_user)
-        self.meds_user_var.set(selected_user)
-        self.history_user_var.set(selected_user)
-        
-        # Update all tabs
-        self.update_dashboard_data()
-        self.update_trends()
-        self.run_analysis()
-        self.update_medications()
-        self.update_medical_history()
+        self.switch_user(event.widget.current())
         
         self.status_message.config(text=f"Selected user: {selected_user}")
     
     def on_trends_user_selected(self, event):
         """Handle user selection in the trends tab"""
-        selected_user = self.trends_user_var.get()
-        
-        self.current_user_id = self.user_ids.get(selected_user)
-        
-        # Update main dropdown to match
-        self.user_var.set(selected_user)
-        self.analysis_user_var.set(selected_user)
-        self.meds_user_var.set(selected_user)
-        self.history_user_var.set(selected_user)
-        
-        # Update trends tab
-        self.update_trends()
+        selected_user = self.user_var.get()
+        self.switch_user(event.widget.current())
         
         self.status_message.config(text=f"Trends updated for user: {selected_user}")
     
     def on_analysis_user_selected(self, event):
         """Handle user selection in the analysis tab"""
-        selected_user = self.analysis_user_var.get()
-        self.current_user_id = self.user_ids.get(selected_user)
-        
-        # Update main dropdown to match
-        self.user_var.set(selected_user)
-        self.trends_user_var.set(selected_user)
-        self.meds_user_var.set(selected_user)
-        self.history_user_var.set(selected_user)
-        
-        # Update analysis tab
-        self.run_analysis()
+        selected_user = self.user_var.get()
+        self.switch_user(event.widget.current())
         
         self.status_message.config(text=f"Analysis updated for user: {selected_user}")
     
     def on_meds_user_selected(self, event):
         """Handle user selection in the medications tab"""
-        selected_user = self.meds_user_var.get()
-        self.current_user_id = self.user_ids.get(selected_user)
-        
-        # Update main dropdown to match
-        self.user_var.set(selected_user)
-        self.trends_user_var.set(selected_user)
-        self.analysis_user_var.set(selected_user)
-        self.history_user_var.set(selected_user)
-        
-        # Update medications tab
-        self.update_medications()
+        selected_user = self.user_var.get()
+        self.switch_user(event.widget.current())
         
         self.status_message.config(text=f"Medications updated for user: {selected_user}")
     
     def on_history_user_selected(self, event):
         """Handle user selection in the medical history tab"""
-        selected_user = self.history_user_var.get()
-        self.current_user_id = self.user_ids.get(selected_user)
-        
-        # Update main dropdown to match
-        self.user_var.set(selected_user)
-        self.trends_user_var.set(selected_user)
-        self.analysis_user_var.set(selected_user)
-        self.meds_user_var.set(selected_user)
-        
-        # Update medical history tab
-        self.update_medical_history()
+        selected_user = self.user_var.get()
+        self.switch_user(event.widget.current())
         
         self.status_message.config(text=f"Medical history updated for user: {selected_user}")
     
@@ -874,26 +1041,84 @@ class HealthMonitorApp:
         if self.current_user_id:
             self.update_dashboard_data()
         
-        # Schedule the next update
-        self.root.after(10000, self.update_data)
+        # Schedule the next update, replacing any pending one (the refresh button
+        # also calls this) and polling less often while the window is minimized
+        if self._poll_job:
+            self.root.after_cancel(self._poll_job)
+        interval = 30000 if self.root.state() == "iconic" else 10000
+        self._poll_job = self.root.after(interval, self.update_data)
+    
+    def schedule_refresh(self, func, *args, delay=150):
+        """Run func(*args) after delay ms, replacing any call of func still pending"""
+        job = self._pending_refresh.pop(func, None)
+        if job:
+            self.root.after_cancel(job)
+        self._pending_refresh[func] = self.root.after(delay, self._run_refresh, func, *args)
+    
+    def _run_refresh(self, func, *args):
+        del self._pending_refresh[func]
+        func(*args)
+    
+    def update_dashboard_data(self, bundle=None):
+        """
+        Update the dashboard with the latest health data; bursts of requests are debounced
+        bundle is an optional prefetched result of DatabaseManager.get_user_bundle
+        """
+        if bundle:
+            # The data is already in hand, so there is nothing to coalesce
+            self._refresh_dashboard(bundle)
+        else:
+            self.schedule_refresh(self._refresh_dashboard)
     
-    def update_dashboard_data(self):
-        """Update the dashboard with the latest health data"""
+    def _refresh_dashboard(self, bundle=None):
+        """Fetch and apply the dashboard data for the current user"""
         if not self.current_user_id:
             return
         
+        self.run_in_background(self._on_dashboard_fetched, self._fetch_dashboard, self.current_user_id, bundle)
+    
+    def _fetch_dashboard(self, user_id, bundle=None):
+        """
+        Fetch and analyze the dashboard data for a user (runs on the worker thread)
+        Returns (user_id, user_info, health_data, analysis)
+        """
+        if bundle:
+            user_info, health_data = bundle
+        else:
+            # Get user info (briefly cached by DatabaseManager) and the latest health data
+            user_info = self.db_manager.get_user_info(user_id)
+            health_data = self.db_manager.get_latest_health_data(user_id)
+        
+        analysis = self._analyze_reading(health_data) if health_data else None
+        return user_id, user_info, health_data, analysis
+    
+    def _on_dashboard_fetched(self, future):
+        """Apply the result of _fetch_dashboard to the dashboard"""
         try:
-            # Get user info with error handling
-            user_info = self.db_manager.get_user_info(self.current_user_id)
-            if not user_info or len(user_info) != 6:  # Check if we have all required fields
+            user_id, user_info, health_data, analysis = future.result()
+            
+            # Drop results for a user that is no longer selected
+            if user_id != self.current_user_id:
+                return
+            
+            if not user_info or len(user_info) < 6:  # Check if we have all required fields
                 messagebox.showwarning("Data Error", "Unable to retrieve complete user information")
                 return
+            
+            # Nothing to redraw if the latest reading is the one already shown
+            if health_data:
+                health_key = (health_data[0], health_data[2])
+            else:
+                health_key = (self.current_user_id, None)
+            if health_key == self._last_health_key:
+                return
                 
-            try:
-                user_id, name, age, gender, height, weight, *_ = user_info
-                
-                # Update user panel with null checks
-                if hasattr(self, 'user_panel'):
+            # Update user panel with null checks (only when the user changed;
+            # setup_dashboard always creates the panel)
+            if user_info is not self._shown_user_info:
+                try:
+                    user_id, name, age, gender, height, weight, *_ = user_info
+                    
                     self.user_panel.update(
                         name or "Unknown",
                         age or "N/A",
@@ -901,90 +1126,91 @@ class HealthMonitorApp:
                         height or "N/A",
                         weight or "N/A"
                     )
-            except ValueError as e:
-                print(f"Error unpacking user info: {e}")
-                return
+                except ValueError as e:
+                    print(f"Error unpacking user info: {e}")
+                    return
+                self._shown_user_info = user_info
             
-            # Get latest health data
-            health_data = self.db_manager.get_latest_health_data(self.current_user_id)
+            self._last_health_key = health_key
             if health_data:
-                record_id, user_id, timestamp, heart_rate, bp_sys, bp_dia, oxygen, temp = health_data
-                
-                # Analyze health data
-                hr_status, hr_msg = self.health_analyzer.analyze_heart_rate(heart_rate)
-                bp_status, bp_msg, sys_msg, dia_msg = self.health_analyzer.analyze_blood_pressure(bp_sys, bp_dia)
-                ox_status, ox_msg = self.health_analyzer.analyze_oxygen_level(oxygen)
-                temp_status, temp_msg = self.health_analyzer.analyze_temperature(temp)
-                
-                # Update heart rate card
-                self.health_cards['heart_rate'].update(
-                    heart_rate, "BPM", 
-                    hr_status, 
-                    "60-100 BPM",
-                    timestamp,
-                    "Heart rate represents the number of times your heart beats per minute."
-                )
-                
-                # Update blood pressure card
-                self.health_cards['blood_pressure'].update(
-                    f"{bp_sys}/{bp_dia}", "mmHg", 
-                    bp_status, 
-                    "Below 120/80 mmHg",
-                    timestamp,
-                    "Blood pressure measures the force of blood pushing against artery walls."
-                )
-                
-                # Update oxygen card
-                self.health_cards['oxygen'].update(
-                    oxygen, "%", 
-                    ox_status, 
-                    "95-100%",
-                    timestamp,
-                    "Oxygen saturation indicates the percentage of hemoglobin binding sites occupied by oxygen."
-                )
-                
-                # Update temperature card
-                self.health_cards['temperature'].update(
-                    temp, "°C", 
-                    temp_status, 
-                    "36.5-37.5°C",
-                    timestamp,
-                    "Body temperature is regulated by the hypothalamus and indicates metabolic health."
-                )
-                
-                # Update overall status
-                overall_status, overall_msg = self.health_analyzer.get_overall_health_status(health_data)
-                
-                # Create alerts list
-                alerts = []
-                if hr_status != "Normal":
-                    alerts.append({'status': hr_status, 'message': hr_msg})
-                if bp_status != "Normal":
-                    alerts.append({'status': bp_status, 'message': sys_msg})
-                    alerts.append({'status': bp_status, 'message': dia_msg})
-                if ox_status != "Normal":
-                    alerts.append({'status': ox_status, 'message': ox_msg})
-                if temp_status != "Normal":
-                    alerts.append({'status': temp_status, 'message': temp_msg})
-                
-                # Update health status panel
-                self.health_status_panel.update(overall_status, alerts)
-                
-                self.status_message.config(text=f"Dashboard updated at {datetime.datetime.now().strftime('%H:%M:%S')}")
+                self._apply_analysis(analysis)
             else:
                 messagebox.showinfo("No Data", "No health data available for this user.")
                 self.status_message.config(text="No health data available")
         except sqlite3.Error as e:
-            self.status_message.config(text=f"Database error: {str(e)[:50]}...")
-            messagebox.showerror("Database Error", f"Failed to update data: {e}")
+            self.show_db_error(f"Failed to update data: {e}", e)
     
-    def update_trends(self):
-        """Update the trends charts with historical data"""
-        selected_user = self.trends_user_var.get()
-        if not selected_user:
-            return
+    def _analyze_reading(self, health_data):
+        """
+        Analyze a health_data record (runs on the worker thread)
+        Returns (card update args by card key, overall status, alerts)
+        """
+        record_id, user_id, timestamp, heart_rate, bp_sys, bp_dia, oxygen, temp = health_data
+        
+        # Analyze health data
+        hr_status, hr_msg = self.health_analyzer.analyze_heart_rate(heart_rate)
+        bp_status, bp_msg, sys_msg, dia_msg = self.health_analyzer.analyze_blood_pressure(bp_sys, bp_dia)
+        ox_status, ox_msg = self.health_analyzer.analyze_oxygen_level(oxygen)
+        temp_status, temp_msg = self.health_analyzer.analyze_temperature(temp)
+        
+        card_updates = {
+            'heart_rate': (
+                heart_rate, "BPM", hr_status, "60-100 BPM", timestamp,
+                "Heart rate represents the number of times your heart beats per minute."
+            ),
+            'blood_pressure': (
+                f"{bp_sys}/{bp_dia}", "mmHg", bp_status, "Below 120/80 mmHg", timestamp,
+                "Blood pressure measures the force of blood pushing against artery walls."
+            ),
+            'oxygen': (
+                oxygen, "%", ox_status, "95-100%", timestamp,
+                "Oxygen saturation indicates the percentage of hemoglobin binding sites occupied by oxygen."
+            ),
+            'temperature': (
+                temp, "°C", temp_status, "36.5-37.5°C", timestamp,
+                "Body temperature is regulated by the hypothalamus and indicates metabolic health."
+            )
+        }
+        
+        # Overall status
+        overall_status, overall_msg = self.health_analyzer.get_overall_health_status(health_data)
+        
+        # Create alerts list from every check that isn't Normal
+        checks = (
+            (hr_status, hr_msg),
+            (bp_status, sys_msg),
+            (bp_status, dia_msg),
+            (ox_status, ox_msg),
+            (temp_status, temp_msg)
+        )
+        alerts = [{'status': status, 'message': msg} for status, msg in checks if status != "Normal"]
+        
+        return card_updates, overall_status, alerts
+    
+    def _apply_analysis(self, analysis):
+        """Apply the result of _analyze_reading to the dashboard in one Tk callback"""
+        card_updates, overall_status, alerts = analysis
+        for card, args in card_updates.items():
+            # Unit, range and info text never change, so only the first update sets them
+            if card in self._filled_cards:
+                value, unit, status, ref_range, timestamp, info = args
+                self.health_cards[card].update_value(value, status, timestamp)
+            else:
+                self.health_cards[card].update(*args)
+                self._filled_cards.add(card)
         
-        user_id = self.user_ids.get(selected_user)
+        # Update health status panel
+        self.health_status_panel.update(overall_status, alerts)
+        
+        self.status_message.config(text=f"Dashboard updated at {datetime.datetime.now().strftime('%H:%M:%S')}")
+    
+    def update_trends(self):
+        """Update the trends charts with historical data; bursts of requests are debounced"""
+        self.schedule_refresh(self._refresh_trends)
+    
+    def _refresh_trends(self):
+        """Redraw the trends charts for the current user and time range"""
+        user_id = self.current_user_id
         if not user_id:
             return
         
@@ -998,15 +1224,7 @@ class HealthMonitorApp:
                 health_data = self.db_manager.get_health_data_by_date_range(user_id, start_date, end_date)
             else:
                 # Convert time range to days
-                days = 1
-                if time_range == "3 Days":
-                    days = 3
-                elif time_range == "1 Week":
-                    days = 7
-                elif time_range == "2 Weeks":
-                    days = 14
-                elif time_range == "1 Month":
-                    days = 30
+                days = _PERIOD_DAYS.get(time_range, 1)
                 
                 health_data = self.db_manager.get_health_data_by_timeframe(user_id, days)
             
@@ -1015,307 +1233,196 @@ class HealthMonitorApp:
                 self.status_message.config(text="No data for selected time range")
                 return
             
-            # Extract data
-            timestamps = [datetime.datetime.strptime(record[2], '%Y-%m-%d %H:%M:%S') for record in health_data]
-            heart_rates = [record[3] for record in health_data]
-            bp_systolic = [record[4] for record in health_data]
-            bp_diastolic = [record[5] for record in health_data]
-            oxygen_levels = [record[6] for record in health_data]
-            temperatures = [record[7] for record in health_data]
+            # Extract data as one array with a column per metric
+            timestamps = np.array([record[2] for record in health_data], dtype='datetime64[s]')
+            metrics = metrics_array(health_data)
+            
+            # Flag readings with an overall Danger status for alert markers
+            statuses = self.health_analyzer.analyze_batch(health_data, metrics)
+            alert_mask = statuses['overall'] == DANGER
             
             # Update charts using the VisualComponents utility
-            VisualComponents.update_charts(
-                self.axes, timestamps, heart_rates, bp_systolic, 
-                bp_diastolic, oxygen_levels, temperatures
-            )
+            VisualComponents.update_charts(self.axes, self.chart_artists, timestamps, *metrics.T, alert_mask)
             
-            # Adjust layout and redraw
-            self.fig.tight_layout()
-            self.canvas.draw()
+            # Lay out once the first real tick labels exist, then just schedule redraws
+            if not self._charts_laid_out:
+                self.fig.tight_layout()
+                self._charts_laid_out = True
+            self.canvas.draw_idle()
             
             self.status_message.config(text=f"Trends chart updated with {len(health_data)} data points")
             
         except sqlite3.Error as e:
-            self.status_message.config(text=f"Database error: {str(e)[:50]}...")
-            messagebox.showerror("Database Error", f"Failed to update trends: {e}")
+            self.show_db_error(f"Failed to update trends: {e}", e)
     
     def run_analysis(self):
-        """Run health analysis and update the analysis tab"""
-        selected_user = self.analysis_user_var.get()
-        if not selected_user:
-            return
-        
-        user_id = self.user_ids.get(selected_user)
+        """Run health analysis and update the analysis tab (the work runs on the worker thread)"""
+        user_id = self.current_user_id
         if not user_id:
             return
         
-        try:
-            # Get user info
-            user_info = self.db_manager.get_user_info(user_id)
-            if not user_info:
-                return
-            
-            # Determine analysis period
-            period = self.analysis_period_var.get()
-            days = 7  # Default to 1 week
-            
-            if period == "1 Day":
-                days = 1
-            elif period == "3 Days":
-                days = 3
-            elif period == "2 Weeks":
-                days = 14
-            elif period == "1 Month":
-                days = 30
-            
-            # Get health data for the period
-            health_data = self.db_manager.get_health_data_by_timeframe(user_id, days)
-            
-            if not health_data:
-                messagebox.showinfo("No Data", "No health data available for the selected period.")
-                return
-            
-            # Get latest health data for current status
-            latest_data = self.db_manager.get_latest_health_data(user_id)
-            
-            # Update summary text
-            self.summary_text.config(state=tk.NORMAL)
-            self.summary_text.delete(1.0, tk.END)
-            
-            user_id, name, age, gender, height, weight = user_info[:6]
-            
-            self.summary_text.insert(tk.END, f"Health Summary for {name}\n\n", "heading")
-            self.summary_text.insert(tk.END, f"Age: {age} | Gender: {gender}\n", "normal")
-            self.summary_text.insert(tk.END, f"Height: {height} cm | Weight: {weight} kg\n\n", "normal")
-            
-            if latest_data:
-                record_id, user_id, timestamp, heart_rate, bp_sys, bp_dia, oxygen, temp = latest_data
-                
-                self.summary_text.insert(tk.END, f"Current Status (as of {timestamp}):\n", "subheading")
-                self.summary_text.insert(tk.END, f"• Heart Rate: {heart_rate} BPM\n", "normal")
-                self.summary_text.insert(tk.END, f"• Blood Pressure: {bp_sys}/{bp_dia} mmHg\n", "normal")
-                self.summary_text.insert(tk.END, f"• Oxygen Level: {oxygen}%\n", "normal")
-                self.summary_text.insert(tk.END, f"• Temperature: {temp}°C\n\n", "normal")
-                
-                # Get overall health status
-                overall_status, overall_msg = self.health_analyzer.get_overall_health_status(latest_data)
-                
-                self.summary_text.insert(tk.END, f"Overall Health Status: {overall_status}\n", "subheading")
-                
-                if overall_status != "Normal":
-                    self.summary_text.insert(tk.END, f"{overall_msg}\n\n", "alert")
-                else:
-                    self.summary_text.insert(tk.END, f"{overall_msg}\n\n", "normal")
-            
-            # Add analysis period info
-            self.summary_text.insert(tk.END, f"Analysis Period: {period}\n", "subheading")
-            self.summary_text.insert(tk.END, f"Data points analyzed: {len(health_data)}\n\n", "normal")
-            
-            # Calculate averages
-            avg_hr = sum(record[3] for record in health_data) / len(health_data)
-            avg_sys = sum(record[4] for record in health_data) / len(health_data)
-            avg_dia = sum(record[5] for record in health_data) / len(health_data)
-            avg_o2 = sum(record[6] for record in health_data) / len(health_data)
-            avg_temp = sum(record[7] for record in health_data) / len(health_data)
-            
-            self.summary_text.insert(tk.END, f"Average Metrics:\n", "subheading")
-            self.summary_text.insert(tk.END, f"• Heart Rate: {avg_hr:.1f} BPM\n", "normal")
-            self.summary_text.insert(tk.END, f"• Blood Pressure: {avg_sys:.1f}/{avg_dia:.1f} mmHg\n", "normal")
-            self.summary_text.insert(tk.END, f"• Oxygen Level: {avg_o2:.1f}%\n", "normal")
-            self.summary_text.insert(tk.END, f"• Temperature: {avg_temp:.1f}°C\n", "normal")
-            
-            self.summary_text.config(state=tk.DISABLED)
+        # Determine analysis period
+        period = self.analysis_period_var.get()
+        days = _PERIOD_DAYS.get(period, 7)  # Default to 1 week
+        
+        self.run_in_background(self._on_analysis_computed, self._compute_analysis, user_id, period, days)
+    
+    def _compute_analysis(self, user_id, period, days):
+        """
+        Fetch and analyze a user's health data for a period (runs on the worker thread)
+        Returns (user_id, name, summary segments, averages, potential conditions),
+        with name None when the user is unknown and summary None when there is no data
+        """
+        # Get user info
+        user_info = self.db_manager.get_user_info(user_id)
+        if not user_info:
+            return user_id, None, None, None, None
+        
+        # Get health data for the period
+        health_data = self.db_manager.get_health_data_by_timeframe(user_id, days)
+        if not health_data:
+            return user_id, user_info[1], None, None, None
+        
+        # Get latest health data for current status
+        latest_data = self.db_manager.get_latest_health_data(user_id)
+        
+        # Build summary text
+        user_id, name, age, gender, height, weight = user_info[:6]
+        
+        summary = [
+            ("heading", f"Health Summary for {name}\n\n"),
+            ("normal", f"Age: {age} | Gender: {gender}\n"
+                       f"Height: {height} cm | Weight: {weight} kg\n\n")
+        ]
+        
+        if latest_data:
+            record_id, user_id, timestamp, heart_rate, bp_sys, bp_dia, oxygen, temp = latest_data
             
-            # Clear previous metrics gauges
-            for widget in self.metrics_container.winfo_children():
-                widget.destroy()
+            summary += [
+                ("subheading", f"Current Status (as of {timestamp}):\n"),
+                ("normal", "\n".join((
+                    f"• Heart Rate: {heart_rate} BPM",
+                    f"• Blood Pressure: {bp_sys}/{bp_dia} mmHg",
+                    f"• Oxygen Level: {oxygen}%",
+                    f"• Temperature: {temp}°C\n\n"
+                )))
+            ]
             
-            # Create new gauges for metrics
-            # Heart Rate
-            hr_gauge = VisualComponents.create_gauge(
-                self.metrics_container, "Heart Rate", 40, 140, avg_hr, "BPM", 
-                warning_threshold=100, danger_threshold=120
-            )
-            hr_gauge.pack(pady=10, fill=tk.X)
+            # Get overall health status
+            overall_status, overall_msg = self.health_analyzer.get_overall_health_status(latest_data)
             
-            # Blood Pressure
-            bp_sys_gauge = VisualComponents.create_gauge(
-                self.metrics_container, "Systolic BP", 90, 180, avg_sys, "mmHg", 
-                warning_threshold=130, danger_threshold=140
-            )
-            bp_sys_gauge.pack(pady=10, fill=tk.X)
+            summary.append(("subheading", f"Overall Health Status: {overall_status}\n"))
             
-            bp_dia_gauge = VisualComponents.create_gauge(
-                self.metrics_container, "Diastolic BP", 50, 120, avg_dia, "mmHg", 
-                warning_threshold=80, danger_threshold=90
-            )
-            bp_dia_gauge.pack(pady=10, fill=tk.X)
+            if overall_status != "Normal":
+                summary.append(("alert", f"{overall_msg}\n\n"))
+            else:
+                summary.append(("normal", f"{overall_msg}\n\n"))
+        
+        # Add analysis period info
+        summary += [
+            ("subheading", f"Analysis Period: {period}\n"),
+            ("normal", f"Data points analyzed: {len(health_data)}\n\n")
+        ]
+        
+        # Calculate averages in one pass over the metrics columns
+        metrics = metrics_array(health_data)
+        averages = metrics.mean(axis=0).tolist()
+        avg_hr, avg_sys, avg_dia, avg_o2, avg_temp = averages
+        
+        summary += [
+            ("subheading", "Average Metrics:\n"),
+            ("normal", "\n".join((
+                f"• Heart Rate: {avg_hr:.1f} BPM",
+                f"• Blood Pressure: {avg_sys:.1f}/{avg_dia:.1f} mmHg",
+                f"• Oxygen Level: {avg_o2:.1f}%",
+                f"• Temperature: {avg_temp:.1f}°C\n"
+            )))
+        ]
+        
+        # Predict potential conditions
+        potential_conditions = self.health_analyzer.predict_potential_conditions(health_data, metrics)
+        
+        return user_id, name, summary, averages, potential_conditions
+    
+    def _on_analysis_computed(self, future):
+        """Apply the result of _compute_analysis to the analysis tab"""
+        try:
+            user_id, name, summary, averages, potential_conditions = future.result()
             
-            # Oxygen Level
-            o2_gauge = VisualComponents.create_gauge(
-                self.metrics_container, "Oxygen Saturation", 85, 100, avg_o2, "%", 
-                warning_threshold=92, danger_threshold=90
-            )
-            o2_gauge.pack(pady=10, fill=tk.X)
+            # Drop results for a user that is no longer selected
+            if user_id != self.current_user_id or name is None:
+                return
             
-            # Temperature
-            temp_gauge = VisualComponents.create_gauge(
-                self.metrics_container, "Temperature", 35, 40, avg_temp, "°C", 
-                warning_threshold=37.5, danger_threshold=38
-            )
-            temp_gauge.pack(pady=10, fill=tk.X)
+            if summary is None:
+                messagebox.showinfo("No Data", "No health data available for the selected period.")
+                return
             
-            # Predict potential conditions
-            potential_conditions = self.health_analyzer.predict_potential_conditions(health_data)
+            VisualComponents.set_rich_text(self.summary_text, summary)
             
-            # Update conditions treeview
-            self.conditions_tree.delete(*self.conditions_tree.get_children())
+            # Create the metrics gauges once, then only move their values
+            if self.metrics_gauges.gauges:
+                self.metrics_gauges.set_values(averages)
+            else:
+                avg_hr, avg_sys, avg_dia, avg_o2, avg_temp = averages
+                self.metrics_gauges.set_gauges([
+                    GaugeSpec("Heart Rate", 40, 140, avg_hr, "BPM", 100, 120),
+                    GaugeSpec("Systolic BP", 90, 180, avg_sys, "mmHg", 130, 140),
+                    GaugeSpec("Diastolic BP", 50, 120, avg_dia, "mmHg", 80, 90),
+                    GaugeSpec("Oxygen Saturation", 85, 100, avg_o2, "%", 92, 90),
+                    GaugeSpec("Temperature", 35, 40, avg_temp, "°C", 37.5, 38)
+                ])
             
+            # Update conditions treeview (item ids are the row indices)
             self.condition_details_data = {}
             
             if potential_conditions:
-                for condition in potential_conditions:
+                condition_rows = []
+                for index, condition in enumerate(potential_conditions):
                     condition_name = condition["condition"]
                     confidence = condition["confidence"]
                     description = condition["description"]
                     
-                    item_id = self.conditions_tree.insert("", "end", values=(condition_name, confidence))
-                    self.condition_details_data[item_id] = description
-                    
-                # Update actions for conditions
-                self.actions_text.config(state=tk.NORMAL)
-                self.actions_text.delete(1.0, tk.END)
-                self.actions_text.insert(tk.END, "Recommended Actions\n\n", "heading")
+                    condition_rows.append(((condition_name, confidence), ()))
+                    self.condition_details_data[str(index)] = description
                 
-                if any(c["condition"] == "Hypertension Risk" for c in potential_conditions):
-                    self.actions_text.insert(tk.END, "• Monitor blood pressure regularly\n", "important")
-                    self.actions_text.insert(tk.END, "• Consider reducing sodium intake\n", "normal")
-                    self.actions_text.insert(tk.END, "• Increase physical activity\n", "normal")
+                self.conditions_view.set_rows(condition_rows)
                     
-                if any(c["condition"] == "Tachycardia Tendency" for c in potential_conditions):
-                    self.actions_text.insert(tk.END, "• Monitor heart rate during activity\n", "important")
-                    self.actions_text.insert(tk.END, "• Consider stress reduction techniques\n", "normal")
-                    self.actions_text.insert(tk.END, "• Limit caffeine and stimulants\n", "normal")
-                    
-                if any(c["condition"] == "Respiratory Concern" for c in potential_conditions):
-                    self.actions_text.insert(tk.END, "• Monitor oxygen levels closely\n", "important")
-                    self.actions_text.insert(tk.END, "• Consider respiratory assessment\n", "normal")
-                
-                if any(c["condition"] == "Recurring Fever" for c in potential_conditions):
-                    self.actions_text.insert(tk.END, "• Monitor temperature regularly\n", "important")
-                    self.actions_text.insert(tk.END, "• Consider evaluation for infection\n", "normal")
+                # Update actions for conditions
+                detected = {c["condition"] for c in potential_conditions}
+                actions = [("heading", "Recommended Actions\n\n")]
+                for condition_name, runs in _CONDITION_ACTIONS.items():
+                    if condition_name in detected:
+                        actions += runs
                 
-                self.actions_text.config(state=tk.DISABLED)
+                VisualComponents.set_rich_text(self.actions_text, actions)
             else:
-                self.conditions_tree.insert("", "end", values=("No conditions detected", ""))
+                self.conditions_view.set_rows([(("No conditions detected", ""), ())])
                 
-                self.actions_text.config(state=tk.NORMAL)
-                self.actions_text.delete(1.0, tk.END)
-                self.actions_text.insert(tk.END, "Recommended Actions\n\n", "heading")
-                self.actions_text.insert(tk.END, "• Continue regular health monitoring\n", "normal")
-                self.actions_text.insert(tk.END, "• Maintain healthy lifestyle habits\n", "normal")
-                self.actions_text.insert(tk.END, "• Schedule routine check-ups\n", "normal")
-                self.actions_text.config(state=tk.DISABLED)
+                VisualComponents.set_rich_text(self.actions_text, _DEFAULT_ACTIONS)
                 
             self.status_message.config(text=f"Health analysis completed for {name}")
                 
         except sqlite3.Error as e:
-            self.status_message.config(text=f"Database error: {str(e)[:50]}...")
-            messagebox.showerror("Database Error", f"Failed to run analysis: {e}")
+            self.show_db_error(f"Failed to run analysis: {e}", e)
     
     def update_medications(self):
         """Update the medications tab with current prescriptions"""
-        selected_user = self.meds_user_var.get()
-        if not selected_user:
-            return
-        
-        user_id = self.user_ids.get(selected_user)
+        selected_user = self.user_var.get()
+        user_id = self.current_user_id
         if not user_id:
             return
         
         try:
-            # In a real application, this would fetch from the database
-            # For this example, we'll use mock data
-            medications = [
-                {
-                    "id": 1,
-                    "name": "Lisinopril",
-                    "dosage": "10mg",
-                    "frequency": "Once daily",
-                    "purpose": "Blood pressure control",
-                    "start_date": "2023-01-15",
-                    "end_date": None,
-                    "prescriber": "Dr. Sarah Johnson",
-                    "notes": "Take in the morning with food",
-                    "side_effects": "Dry cough, dizziness, headache",
-                    "interactions": "NSAIDs may reduce effectiveness"
-                },
-                {
-                    "id": 2,
-                    "name": "Metformin",
-                    "dosage": "500mg",
-                    "frequency": "Twice daily",
-                    "purpose": "Diabetes management",
-                    "start_date": "2023-02-10",
-                    "end_date": None,
-                    "prescriber": "Dr. Michael Chen",
-                    "notes": "Take with meals to reduce GI side effects",
-                    "side_effects": "Nausea, diarrhea, stomach upset",
-                    "interactions": "Alcohol may increase risk of lactic acidosis"
-                },
-                {
-                    "id": 3,
-                    "name": "Atorvastatin",
-                    "dosage": "20mg",
-                    "frequency": "Once daily",
-                    "purpose": "Cholesterol management",
-                    "start_date": "2023-03-05",
-                    "end_date": None,
-                    "prescriber": "Dr. Sarah Johnson",
-                    "notes": "Take in the evening",
-                    "side_effects": "Muscle pain, liver enzyme elevation",
-                    "interactions": "Grapefruit juice may increase side effects"
-                }
-            ]
-            
-            # Clear current medications tree
-            self.current_meds_tree.delete(*self.current_meds_tree.get_children())
-            
-            # Add medications to tree
-            for med in medications:
-                self.current_meds_tree.insert("", "end", values=(
-                    med["name"],
-                    med["dosage"],
-                    med["frequency"],
-                    med["purpose"],
-                    med["start_date"]
-                ), tags=(str(med["id"]),))
+            # Replace the medications shown in the tree
+            self.current_meds_view.set_rows(_MED_ROWS)
             
             # Clear medication details
-            self.med_details_text.config(state=tk.NORMAL)
-            self.med_details_text.delete(1.0, tk.END)
-            self.med_details_text.insert(tk.END, "Select a medication to view details", "normal")
-            self.med_details_text.config(state=tk.DISABLED)
-            
-            # Clear medication history
-            self.med_history_text.config(state=tk.NORMAL)
-            self.med_history_text.delete(1.0, tk.END)
-            self.med_history_text.insert(tk.END, "Medication History\n\n", "heading")
-            
-            # Add mock medication history
-            self.med_history_text.insert(tk.END, "2023-01-15: ", "date")
-            self.med_history_text.insert(tk.END, "Started Lisinopril 10mg daily for hypertension\n\n", "normal")
-            
-            self.med_history_text.insert(tk.END, "2023-02-10: ", "date")
-            self.med_history_text.insert(tk.END, "Started Metformin 500mg twice daily for diabetes\n\n", "normal")
+            VisualComponents.set_rich_text(self.med_details_text, [
+                ("normal", "Select a medication to view details")
+            ])
             
-            self.med_history_text.insert(tk.END, "2023-03-05: ", "date")
-            self.med_history_text.insert(tk.END, "Started Atorvastatin 20mg daily for high cholesterol\n\n", "normal")
-            
-            self.med_history_text.insert(tk.END, "2023-04-20: ", "date")
-            self.med_history_text.insert(tk.END, "Lisinopril dosage adjusted from 5mg to 10mg due to inadequate BP control\n\n", "normal")
-            
-            self.med_history_text.config(state=tk.DISABLED)
+            # Show mock medication history
+            VisualComponents.set_rich_text(self.med_history_text, _MED_HISTORY)
             
             self.status_message.config(text=f"Medications updated for {selected_user}")
             
@@ -1331,161 +1438,33 @@ class HealthMonitorApp:
             return
         
         # Get the medication name from the selected item
-        med_name = self.current_meds_tree.item(selected_items[0])['values'][0]
-        
-        # Mock medication details - in a real app, this would come from the database
-        med_details = {
-            "Lisinopril": {
-                "name": "Lisinopril",
-                "class": "ACE Inhibitor",
-                "dosage": "10mg",
-                "frequency": "Once daily",
-                "purpose": "Blood pressure control",
-                "start_date": "2023-01-15",
-                "prescriber": "Dr. Sarah Johnson",
-                "notes": "Take in the morning with food",
-                "side_effects": "Dry cough, dizziness, headache",
-                "interactions": "NSAIDs may reduce effectiveness",
-                "monitoring": "Regular blood pressure checks, kidney function tests"
-            },
-            "Metformin": {
-                "name": "Metformin",
-                "class": "Biguanide",
-                "dosage": "500mg",
-                "frequency": "Twice daily",
-                "purpose": "Diabetes management",
-                "start_date": "2023-02-10",
-                "prescriber": "Dr. Michael Chen",
-                "notes": "Take with meals to reduce GI side effects",
-                "side_effects": "Nausea, diarrhea, stomach upset",
-                "interactions": "Alcohol may increase risk of lactic acidosis",
-                "monitoring": "Regular HbA1c tests, kidney function"
-            },
-            "Atorvastatin": {
-                "name": "Atorvastatin",
-                "class": "Statin",
-                "dosage": "20mg",
-                "frequency": "Once daily",
-                "purpose": "Cholesterol management",
-                "start_date": "2023-03-05",
-                "prescriber": "Dr. Sarah Johnson",
-                "notes": "Take in the evening",
-                "side_effects": "Muscle pain, liver enzyme elevation",
-                "interactions": "Grapefruit juice may increase side effects",
-                "monitoring": "Regular lipid panel, liver function tests"
-            }
-        }
+        med_name = self.current_meds_view.row_values(selected_items[0])[0]
         
-        details = med_details.get(med_name, {})
-        if not details:
+        segments = _MED_SEGMENTS.get(med_name)
+        if not segments:
             return
         
         # Update medication details text
-        self.med_details_text.config(state=tk.NORMAL)
-        self.med_details_text.delete(1.0, tk.END)
-        
-        self.med_details_text.insert(tk.END, f"{details['name']} ({details['class']})\n\n", "heading")
-        self.med_details_text.insert(tk.END, f"Dosage: {details['dosage']} {details['frequency']}\n", "normal")
-        self.med_details_text.insert(tk.END, f"Purpose: {details['purpose']}\n", "normal")
-        self.med_details_text.insert(tk.END, f"Prescribed by: {details['prescriber']} on {details['start_date']}\n\n", "normal")
-        
-        self.med_details_text.insert(tk.END, "Instructions:\n", "subheading")
-        self.med_details_text.insert(tk.END, f"{details['notes']}\n\n", "normal")
-        
-        self.med_details_text.insert(tk.END, "Potential Side Effects:\n", "subheading")
-        self.med_details_text.insert(tk.END, f"{details['side_effects']}\n\n", "normal")
-        
-        self.med_details_text.insert(tk.END, "Drug Interactions:\n", "subheading")
-        self.med_details_text.insert(tk.END, f"{details['interactions']}\n\n", "warning")
-        
-        self.med_details_text.insert(tk.END, "Monitoring Required:\n", "subheading")
-        self.med_details_text.insert(tk.END, f"{details['monitoring']}\n", "normal")
-        
-        self.med_details_text.config(state=tk.DISABLED)
+        VisualComponents.set_rich_text(self.med_details_text, segments)
     
     def update_medical_history(self):
         """Update the medical history tab with diagnoses and conditions"""
-        selected_user = self.history_user_var.get()
-        if not selected_user:
-            return
-        
-        user_id = self.user_ids.get(selected_user)
+        selected_user = self.user_var.get()
+        user_id = self.current_user_id
         if not user_id:
             return
         
         try:
-            # In a real application, this would fetch from the database
-            # For this example, we'll use mock data
-            conditions = [
-                {
-                    "id": 1,
-                    "name": "Hypertension",
-                    "diagnosed_date": "2022-11-10",
-                    "status": "Active",
-                    "severity": "Moderate",
-                    "description": "Essential hypertension with systolic readings consistently above 140 mmHg",
-                    "treating_physician": "Dr. Sarah Johnson",
-                    "notes": "Family history of hypertension. Patient advised on lifestyle modifications."
-                },
-                {
-                    "id": 2,
-                    "name": "Type 2 Diabetes",
-                    "diagnosed_date": "2022-12-05",
-                    "status": "Active",
-                    "severity": "Mild",
-                    "description": "Type 2 diabetes mellitus with HbA1c of 7.2%",
-                    "treating_physician": "Dr. Michael Chen",
-                    "notes": "Currently managed with oral medication and diet. Regular monitoring required."
-                },
-                {
-                    "id": 3,
-                    "name": "Hyperlipidemia",
-                    "diagnosed_date": "2023-01-20",
-                    "status": "Active",
-                    "severity": "Mild",
-                    "description": "Elevated LDL cholesterol levels",
-                    "treating_physician": "Dr. Sarah Johnson",
-                    "notes": "Dietary changes implemented with statin therapy."
-                }
-            ]
-            
-            # Clear diagnoses tree
-            self.diagnoses_tree.delete(*self.diagnoses_tree.get_children())
-            
-            # Add conditions to tree
-            for condition in conditions:
-                self.diagnoses_tree.insert("", "end", values=(
-                    condition["name"],
-                    condition["diagnosed_date"],
-                    condition["status"],
-                    condition["severity"]
-                ), tags=(str(condition["id"]),))
+            # Replace the conditions shown in the tree
+            self.diagnoses_view.set_rows(_CONDITION_ROWS)
             
             # Clear condition details
-            self.condition_details_text.config(state=tk.NORMAL)
-            self.condition_details_text.delete(1.0, tk.END)
-            self.condition_details_text.insert(tk.END, "Select a condition to view details", "normal")
-            self.condition_details_text.config(state=tk.DISABLED)
-            
-            # Clear treatment history
-            self.treatment_history_text.config(state=tk.NORMAL)
-            self.treatment_history_text.delete(1.0, tk.END)
-            self.treatment_history_text.insert(tk.END, "Treatment History\n\n", "heading")
-            
-            # Add mock treatment history
-            self.treatment_history_text.insert(tk.END, "2022-11-10: ", "date")
-            self.treatment_history_text.insert(tk.END, "Diagnosed with hypertension. Started on Lisinopril 5mg daily.\n\n", "normal")
-            
-            self.treatment_history_text.insert(tk.END, "2022-12-05: ", "date")
-            self.treatment_history_text.insert(tk.END, "Diagnosed with Type 2 Diabetes. Started on Metformin 500mg daily.\n\n", "normal")
+            VisualComponents.set_rich_text(self.condition_details_text, [
+                ("normal", "Select a condition to view details")
+            ])
             
-            self.treatment_history_text.insert(tk.END, "2023-01-20: ", "date")
-            self.treatment_history_text.insert(tk.END, "Diagnosed with hyperlipidemia. Started on Atorvastatin 20mg daily.\n\n", "normal")
-            
-            self.treatment_history_text.insert(tk.END, "2023-04-20: ", "date")
-            self.treatment_history_text.insert(tk.END, "Follow-up for hypertension. BP still elevated. Lisinopril increased to 10mg daily.\n\n", "normal")
-            
-            self.treatment_history_text.config(state=tk.DISABLED)
+            # Show mock treatment history
+            VisualComponents.set_rich_text(self.treatment_history_text, _TREATMENT_HISTORY)
             
             self.status_message.config(text=f"Medical history updated for {selected_user}")
             
@@ -1501,76 +1480,14 @@ class HealthMonitorApp:
             return
         
         # Get the condition name from the selected item
-        condition_name = self.diagnoses_tree.item(selected_items[0])['values'][0]
-        
-        # Mock condition details - in a real app, this would come from the database
-        condition_details = {
-            "Hypertension": {
-                "name": "Hypertension",
-                "diagnosed_date": "2022-11-10",
-                "status": "Active",
-                "severity": "Moderate",
-                "description": "Essential hypertension with systolic readings consistently above 140 mmHg",
-                "treating_physician": "Dr. Sarah Johnson",
-                "notes": "Family history of hypertension. Patient advised on lifestyle modifications.",
-                "risk_factors": "Family history, sedentary lifestyle, high sodium diet",
-                "complications": "Increased risk of heart disease, stroke, kidney damage",
-                "treatment_plan": "Medication (ACE inhibitor), dietary changes, regular exercise, stress management"
-            },
-            "Type 2 Diabetes": {
-                "name": "Type 2 Diabetes",
-                "diagnosed_date": "2022-12-05",
-                "status": "Active",
-                "severity": "Mild",
-                "description": "Type 2 diabetes mellitus with HbA1c of 7.2%",
-                "treating_physician": "Dr. Michael Chen",
-                "notes": "Currently managed with oral medication and diet. Regular monitoring required.",
-                "risk_factors": "Family history, obesity, sedentary lifestyle",
-                "complications": "Neuropathy, retinopathy, cardiovascular disease",
-                "treatment_plan": "Metformin, dietary changes, regular exercise, blood glucose monitoring"
-            },
-            "Hyperlipidemia": {
-                "name": "Hyperlipidemia",
-                "diagnosed_date": "2023-01-20",
-                "status": "Active",
-                "severity": "Mild",
-                "description": "Elevated LDL cholesterol levels",
-                "treating_physician": "Dr. Sarah Johnson",
-                "notes": "Dietary changes implemented with statin therapy.",
-                "risk_factors": "Diet high in saturated fats, family history, obesity",
-                "complications": "Atherosclerosis, coronary artery disease",
-                "treatment_plan": "Statin therapy, dietary changes, regular exercise, lipid panel monitoring"
-            }
-        }
+        condition_name = self.diagnoses_view.row_values(selected_items[0])[0]
         
-        details = condition_details.get(condition_name, {})
-        if not details:
+        segments = _CONDITION_SEGMENTS.get(condition_name)
+        if not segments:
             return
         
         # Update condition details text
-        self.condition_details_text.config(state=tk.NORMAL)
-        self.condition_details_text.delete(1.0, tk.END)
-        
-        self.condition_details_text.insert(tk.END, f"{details['name']}\n\n", "heading")
-        self.condition_details_text.insert(tk.END, f"Diagnosed: {details['diagnosed_date']} by {details['treating_physician']}\n", "normal")
-        self.condition_details_text.insert(tk.END, f"Status: {details['status']} | Severity: {details['severity']}\n\n", "normal")
-        
-        self.condition_details_text.insert(tk.END, "Description:\n", "subheading")
-        self.condition_details_text.insert(tk.END, f"{details['description']}\n\n", "normal")
-        
-        self.condition_details_text.insert(tk.END, "Risk Factors:\n", "subheading")
-        self.condition_details_text.insert(tk.END, f"{details['risk_factors']}\n\n", "normal")
-        
-        self.condition_details_text.insert(tk.END, "Potential Complications:\n", "subheading")
-        self.condition_details_text.insert(tk.END, f"{details['complications']}\n\n", "normal")
-        
-        self.condition_details_text.insert(tk.END, "Treatment Plan:\n", "subheading")
-        self.condition_details_text.insert(tk.END, f"{details['treatment_plan']}\n\n", "normal")
-        
-        self.condition_details_text.insert(tk.END, "Notes:\n", "subheading")
-        self.condition_details_text.insert(tk.END, f"{details['notes']}\n", "normal")
-        
-        self.condition_details_text.config(state=tk.DISABLED)
+        VisualComponents.set_rich_text(self.condition_details_text, segments)
     
     def show_condition_details(self, event):
         """Show details for the selected condition"""
@@ -1582,15 +1499,13 @@ class HealthMonitorApp:
         item_id = selected_items[0]
         description = self.condition_details_data.get(item_id, "No details available")
         
-        self.condition_details.config(state=tk.NORMAL)
-        self.condition_details.delete(1.0, tk.END)
-        
         # Get the condition name
-        condition = self.conditions_tree.item(item_id)['values'][0]
+        condition = self.conditions_view.row_values(item_id)[0]
         
-        self.condition_details.insert(tk.END, f"{condition}\n\n", "heading")
-        self.condition_details.insert(tk.END, description, "normal")
-        self.condition_details.config(state=tk.DISABLED)
+        VisualComponents.set_rich_text(self.condition_details, [
+            ("heading", f"{condition}\n\n"),
+            ("normal", description)
+        ])
 
 def main():
     # Create database if it doesn't exist
@@ -1,4 +1,68 @@
+import bisect
 import datetime
+import functools
+import itertools
+import operator
+import sys
+from collections import namedtuple
+import numpy as np
+
+# Dose times per frequency phrase, checked in order (first match wins)
+_FREQUENCY_TIMES = (
+    ("once daily", ("08:00",)),
+    ("twice daily", ("08:00", "20:00")),
+    ("three times daily", ("08:00", "14:00", "20:00")),
+    ("four times daily", ("08:00", "12:00", "16:00", "20:00")),
+    ("with breakfast", ("08:00",)),
+    ("with dinner", ("19:00",)),
+    ("before bed", ("22:00",)),
+    ("as needed", ("As needed",))
+)
+_FREQUENCY_EXACT = dict(_FREQUENCY_TIMES)
+_DEFAULT_TIMES = ("08:00",)
+
+# Minutes after midnight for every dose time, for sorting ("As needed" goes last)
+_TIME_MINUTES = {
+    time_slot: 24 * 60 if time_slot == "As needed" else int(time_slot[:2]) * 60 + int(time_slot[3:])
+    for _, times in _FREQUENCY_TIMES for time_slot in times
+}
+
+# Example interactions - in a real system, you would use a comprehensive
+# drug interaction database or API
+_INTERACTION_PAIRS = (
+    ("Lisinopril", "Potassium supplements", "May cause high potassium levels"),
+    ("Metformin", "Ibuprofen", "May affect kidney function"),
+    ("Warfarin", "Aspirin", "Increased bleeding risk"),
+    ("Simvastatin", "Amlodipine", "Increased risk of muscle pain"),
+    ("Fluoxetine", "Tramadol", "Risk of serotonin syndrome"),
+    ("Levothyroxine", "Calcium supplements", "Reduced absorption of thyroid medication")
+)
+
+# Interactions keyed by the unordered (interned) medication pair, with their table position
+_INTERACTIONS = {
+    frozenset((sys.intern(med1), sys.intern(med2))): (index, med1, med2, warning)
+    for index, (med1, med2, warning) in enumerate(_INTERACTION_PAIRS)
+}
+
+# Adherence rates at which each status starts, and the statuses between them
+_ADHERENCE_THRESHOLDS = (0.75, 0.85, 0.95)
+_ADHERENCE_STATUSES = ("Poor", "Fair", "Good", "Excellent")
+
+ScheduleEntry = namedtuple("ScheduleEntry", "name dosage time purpose notes sort_minutes")
+
+@functools.lru_cache(maxsize=None)
+def _frequency_times(frequency):
+    """Map a frequency string to its shared tuple of dose times"""
+    frequency = frequency.lower()
+    
+    times = _FREQUENCY_EXACT.get(frequency)
+    if times:
+        return times
+    
+    for phrase, times in _FREQUENCY_TIMES:
+        if phrase in frequency:
+            return times
+    return _DEFAULT_TIMES
 
 class MedicationManager:
     """Class to manage medication schedules and reminders"""
@@ -8,7 +72,7 @@ class MedicationManager:
         self.db_manager = db_manager
     
     def get_daily_schedule(self, user_id):
-        """Get the daily medication schedule for a user"""
+        """Get the daily medication schedule for a user as ScheduleEntry tuples sorted by time"""
         medications = self.db_manager.get_user_medications(user_id)
         
         if not medications:
@@ -18,52 +82,22 @@ class MedicationManager:
         schedule = []
         
         for med in medications:
+            med_name = sys.intern(med['name'])
             times = self._parse_frequency(med['frequency'])
+            notes = f"Prescribed by {med['prescribing_doctor']}"
             
             for time_slot in times:
-                schedule.append({
-                    'name': med['name'],
-                    'dosage': med['dosage'],
-                    'time': time_slot,
-                    'purpose': med['purpose'],
-                    'notes': f"Prescribed by {med['prescribing_doctor']}"
-                })
+                schedule.append(ScheduleEntry(med_name, med['dosage'], time_slot, med['purpose'],
+                                              notes, _TIME_MINUTES[time_slot]))
         
         # Sort by time
-        schedule.sort(key=lambda x: self._time_to_minutes(x['time']))
+        schedule.sort(key=operator.attrgetter('sort_minutes'))
         
         return schedule
     
     def _parse_frequency(self, frequency):
-        """Parse medication frequency into specific times"""
-        frequency = frequency.lower()
-        
-        if "once daily" in frequency:
-            return ["08:00"]
-        elif "twice daily" in frequency:
-            return ["08:00", "20:00"]
-        elif "three times daily" in frequency:
-            return ["08:00", "14:00", "20:00"]
-        elif "four times daily" in frequency:
-            return ["08:00", "12:00", "16:00", "20:00"]
-        elif "with breakfast" in frequency:
-            return ["08:00"]
-        elif "with dinner" in frequency:
-            return ["19:00"]
-        elif "before bed" in frequency:
-            return ["22:00"]
-        elif "as needed" in frequency:
-            return ["As needed"]
-        else:
-            return ["08:00"]  # Default
-    
-    def _time_to_minutes(self, time_str):
-        """Convert time string to minutes for sorting"""
-        if time_str == "As needed":
-            return 24 * 60  # Put at the end
-        
-        hours, minutes = map(int, time_str.split(':'))
-        return hours * 60 + minutes
+        """Parse medication frequency into specific times (a shared tuple)"""
+        return _frequency_times(frequency)
     
     def get_medication_interactions(self, user_id):
         """Check for potential medication interactions"""
@@ -72,30 +106,21 @@ class MedicationManager:
         if not medications or len(medications) < 2:
             return []
         
-        # This is a simplified example - in a real system, you would use a comprehensive
-        # drug interaction database or API
+        # Interned so the pair lookups below compare names by identity
+        med_names = frozenset(sys.intern(med['name']) for med in medications)
+        if len(med_names) < 2:
+            return []
         
-        # Define some example interactions
-        interaction_pairs = [
-            ("Lisinopril", "Potassium supplements", "May cause high potassium levels"),
-            ("Metformin", "Ibuprofen", "May affect kidney function"),
-            ("Warfarin", "Aspirin", "Increased bleeding risk"),
-            ("Simvastatin", "Amlodipine", "Increased risk of muscle pain"),
-            ("Fluoxetine", "Tramadol", "Risk of serotonin syndrome"),
-            ("Levothyroxine", "Calcium supplements", "Reduced absorption of thyroid medication")
-        ]
+        # Look up every pair of the user's medications, reported in table order
+        hits = filter(None, (_INTERACTIONS.get(frozenset(pair)) for pair in itertools.combinations(med_names, 2)))
         
-        # Check for interactions
         found_interactions = []
-        med_names = [med['name'] for med in medications]
-        
-        for med1, med2, warning in interaction_pairs:
-            if med1 in med_names and med2 in med_names:
-                found_interactions.append({
-                    'medications': [med1, med2],
-                    'warning': warning,
-                    'severity': 'Moderate'  # In a real system, this would vary
-                })
+        for _, med1, med2, warning in sorted(hits):
+            found_interactions.append({
+                'medications': [med1, med2],
+                'warning': warning,
+                'severity': 'Moderate'  # In a real system, this would vary
+            })
         
         return found_interactions
     
@@ -110,33 +135,23 @@ class MedicationManager:
             return []
         
         # In a real system, you would have actual adherence data
-        # Here we'll simulate it with random but realistic values
-        import random
-        
-        adherence_data = []
+        # Here we'll simulate it with random but realistic values, for all medications at once
+        rates = np.random.default_rng().uniform(0.7, 1.0, size=len(medications))  # 70-100% adherence
+        missed_doses = ((1 - rates) * days).astype(int)
+        status_indices = np.searchsorted(_ADHERENCE_THRESHOLDS, rates, side='right')
         
-        for med in medications:
-            # Generate simulated adherence data
-            adherence_rate = random.uniform(0.7, 1.0)  # 70-100% adherence
-            missed_doses = int((1 - adherence_rate) * days)
-            
-            adherence_data.append({
+        return [
+            {
                 'medication': med['name'],
-                'adherence_rate': round(adherence_rate * 100, 1),
-                'missed_doses': missed_doses,
+                'adherence_rate': rate,
+                'missed_doses': missed,
                 'days_tracked': days,
-                'status': self._get_adherence_status(adherence_rate)
-            })
-        
-        return adherence_data
+                'status': _ADHERENCE_STATUSES[status_index]
+            }
+            for med, rate, missed, status_index in zip(
+                medications, np.round(rates * 100, 1).tolist(), missed_doses.tolist(), status_indices.tolist())
+        ]
     
     def _get_adherence_status(self, rate):
         """Get a status description based on adherence rate"""
-        if rate >= 0.95:
-            return "Excellent"
-        elif rate >= 0.85:
-            return "Good"
-        elif rate >= 0.75:
-            return "Fair"
-        else:
-            return "Poor"
+        return _ADHERENCE_STATUSES[bisect.bisect_right(_ADHERENCE_THRESHOLDS, rate)]
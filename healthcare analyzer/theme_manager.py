@@ -2,6 +2,18 @@ import tkinter as tk
 from tkinter import ttk
 import platform
 
+# ttk style names used by the widgets
+CARD_FRAME = "Card.TFrame"
+CARD_LABEL = "Card.TLabel"
+CARD_CHECKBUTTON = "Card.TCheckbutton"
+CARD_TREEVIEW = "Card.Treeview"
+PRIMARY_BUTTON = "Primary.TButton"
+SUBHEADER_LABEL = "SubHeader.TLabel"
+
+# Base ttk theme for the platform (Linux and others use clam)
+_PLATFORM = platform.system()
+_THEME_BY_OS = {"Windows": "vista", "Darwin": "aqua"}
+
 class ThemeManager:
     """Manages the application theme and styling"""
     
@@ -29,61 +41,58 @@ class ThemeManager:
         'Unknown': '#95A5A6',      # Gray
     }
     
+    # Style names of the status indicators
+    STATUS_LABEL_STYLES = {status: f'{status}.TLabel' for status in STATUS_COLORS}
+    STATUS_FRAME_STYLES = {status: f'{status}.TFrame' for status in STATUS_COLORS}
+    
+    # Colored buttons as (style, background, active background)
+    BUTTON_STYLES = (
+        (PRIMARY_BUTTON, COLORS['primary'], '#1A252F'),
+        ('Success.TButton', COLORS['accent'], '#27AE60'),
+        ('Warning.TButton', COLORS['warning'], '#D35400'),
+        ('Danger.TButton', COLORS['danger'], '#C0392B')
+    )
+    
     @classmethod
     def setup_theme(cls, root):
         """Set up the application theme"""
+        # Configure root window
+        root.configure(bg=cls.COLORS['background'])
+        
+        # ttk styles belong to the root's Tcl interpreter, so configure them once per root
+        if getattr(root, '_theme_configured', False):
+            return
+        root._theme_configured = True
+        
         # Configure the base style
-        style = ttk.Style()
+        style = ttk.Style(root)
         
         # Try to use a more modern theme as a base depending on platform
-        if platform.system() == 'Windows':
-            try:
-                style.theme_use('vista')
-            except:
-                pass
-        elif platform.system() == 'Darwin':  # macOS
-            try:
-                style.theme_use('aqua')
-            except:
-                pass
-        else:  # Linux and others
-            try:
-                style.theme_use('clam')
-            except:
-                pass
-        
-        # Configure root window
-        root.configure(bg=cls.COLORS['background'])
+        try:
+            style.theme_use(_THEME_BY_OS.get(_PLATFORM, 'clam'))
+        except tk.TclError:
+            pass
         
         # Configure ttk styles
         style.configure('TFrame', background=cls.COLORS['background'])
-        style.configure('Card.TFrame', background=cls.COLORS['card'])
+        style.configure(CARD_FRAME, background=cls.COLORS['card'])
         
         style.configure('TLabel', background=cls.COLORS['background'], foreground=cls.COLORS['text_dark'])
-        style.configure('Card.TLabel', background=cls.COLORS['card'])
+        style.configure(CARD_LABEL, background=cls.COLORS['card'])
+        style.configure(CARD_CHECKBUTTON, background=cls.COLORS['card'])
+        style.configure(CARD_TREEVIEW, background=cls.COLORS['card'], fieldbackground=cls.COLORS['card'])
         style.configure('Header.TLabel', font=('Arial', 14, 'bold'), foreground=cls.COLORS['primary'])
-        style.configure('SubHeader.TLabel', font=('Arial', 12, 'bold'), foreground=cls.COLORS['primary'])
+        style.configure(SUBHEADER_LABEL, font=('Arial', 12, 'bold'), foreground=cls.COLORS['primary'])
         
         style.configure('TButton', background=cls.COLORS['secondary'], foreground=cls.COLORS['text_light'])
         style.map('TButton', 
                   background=[('active', cls.COLORS['info'])],
                   foreground=[('active', cls.COLORS['text_light'])])
         
-        style.configure('Primary.TButton', background=cls.COLORS['primary'])
-        style.map('Primary.TButton', 
-                  background=[('active', '#1A252F')])  # Darker version of primary
-                  
-        style.configure('Success.TButton', background=cls.COLORS['accent'])
-        style.map('Success.TButton', 
-                  background=[('active', '#27AE60')])  # Darker version of accent
-                  
-        style.configure('Warning.TButton', background=cls.COLORS['warning'])
-        style.map('Warning.TButton', 
-                  background=[('active', '#D35400')])  # Darker version of warning
-                 
-        style.configure('Danger.TButton', background=cls.COLORS['danger'])
-        style.map('Danger.TButton', 
-                  background=[('active', '#C0392B')])  # Darker version of danger
+        # Colored buttons, darker while active
+        for name, background, active in cls.BUTTON_STYLES:
+            style.configure(name, background=background)
+            style.map(name, background=[('active', active)])
         
         style.configure('TNotebook', background=cls.COLORS['background'])
         style.configure('TNotebook.Tab', background=cls.COLORS['neutral'], 
@@ -100,32 +109,36 @@ class ThemeManager:
         
         # Configure status indicator styles
         for status, color in cls.STATUS_COLORS.items():
-            style.configure(f'{status}.TLabel', foreground=color, font=('Arial', 10, 'bold'))
-            style.configure(f'{status}.TFrame', background=color)
+            style.configure(cls.STATUS_LABEL_STYLES[status], foreground=color, font=('Arial', 10, 'bold'))
+            style.configure(cls.STATUS_FRAME_STYLES[status], background=color)
     
     @classmethod
     def create_tooltip(cls, widget, text):
-        """Create a tooltip for a widget"""
+        """Create a tooltip for a widget (its window is created on first hover, then reused)"""
         def enter(event):
             x, y, _, _ = widget.bbox("insert")
             x += widget.winfo_rootx() + 25
             y += widget.winfo_rooty() + 25
             
-            # Create a toplevel window
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{x}+{y}")
-            
-            label = ttk.Label(tooltip, text=text, justify='left',
-                             background=cls.COLORS['primary'], foreground=cls.COLORS['text_light'],
-                             relief='solid', borderwidth=1, padding=(5, 3))
-            label.pack()
+            tooltip = getattr(widget, 'tooltip', None)
+            if tooltip is None:
+                # Create a toplevel window
+                tooltip = tk.Toplevel(widget)
+                tooltip.wm_overrideredirect(True)
+                
+                label = ttk.Label(tooltip, text=text, justify='left',
+                                 background=cls.COLORS['primary'], foreground=cls.COLORS['text_light'],
+                                 relief='solid', borderwidth=1, padding=(5, 3))
+                label.pack()
+                
+                widget.tooltip = tooltip
             
-            widget.tooltip = tooltip
+            tooltip.wm_geometry(f"+{x}+{y}")
+            tooltip.deiconify()
             
         def leave(event):
             if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
+                widget.tooltip.withdraw()
                 
         widget.bind("<Enter>", enter)
         widget.bind("<Leave>", leave)
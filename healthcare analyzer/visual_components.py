@@ -5,22 +5,34 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.dates as mdates
 import numpy as np
 
-from theme_manager import ThemeManager
+from theme_manager import ThemeManager, CARD_TREEVIEW
+
+# rcParams applied on top of the ggplot style
+_MPL_STYLE = {
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
+    'axes.facecolor': '#FFFFFF',
+    'axes.edgecolor': '#CCCCCC',
+    'axes.grid': True,
+    'grid.color': '#EEEEEE',
+    'figure.facecolor': '#FFFFFF'
+}
 
 class VisualComponents:
     """Utility class for creating visual components"""
     
-    @staticmethod
-    def setup_matplotlib_style():
+    # rcParams are process-wide, so the style is applied only once
+    _style_configured = False
+    
+    @classmethod
+    def setup_matplotlib_style(cls):
         """Configure matplotlib styling for the application"""
+        if cls._style_configured:
+            return
+        cls._style_configured = True
+        
         plt.style.use('ggplot')
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
-        plt.rcParams['axes.facecolor'] = '#FFFFFF'
-        plt.rcParams['axes.edgecolor'] = '#CCCCCC'
-        plt.rcParams['axes.grid'] = True
-        plt.rcParams['grid.color'] = '#EEEEEE'
-        plt.rcParams['figure.facecolor'] = '#FFFFFF'
+        plt.rcParams.update(_MPL_STYLE)
         
     @staticmethod
     def create_health_indicator(parent, width=100, height=30):
@@ -40,8 +52,8 @@ class VisualComponents:
         
         # Create a method to update the indicator
         def update_status(status):
-            status_label.config(text=status, style=f"{status}.TLabel")
-            indicator.config(style=f"{status}.TFrame")
+            status_label.config(text=status, style=ThemeManager.STATUS_LABEL_STYLES[status])
+            indicator.config(style=ThemeManager.STATUS_FRAME_STYLES[status])
         
         # Attach the method to the frame
         frame.update_status = update_status
@@ -49,103 +61,147 @@ class VisualComponents:
         return frame
         
     @staticmethod
-    def create_gauge(parent, label, min_val, max_val, initial_val, unit="", width=200, height=120, 
-                    warning_threshold=None, danger_threshold=None):
-        """Create a gauge widget for displaying a health metric"""
-        frame = ttk.Frame(parent, width=width, height=height)
-        frame.pack_propagate(False)  # Don't shrink
+    def create_scrolled_text(parent, height, tags, width=None, scroll=True):
+        """Create a read-only Text (with optional scrollbar) packed directly into parent"""
+        text_widget = tk.Text(parent, wrap=tk.WORD, height=height, bg=ThemeManager.COLORS['card'],
+                              bd=0, highlightthickness=0, undo=False)
+        if width:
+            text_widget.config(width=width)
+        
+        if scroll:
+            scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=text_widget.yview)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 10), pady=10)
+            text_widget.config(yscrollcommand=scrollbar.set)
+            text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
+        else:
+            text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        text_widget.config(state=tk.DISABLED)
+        
+        # Configure text tags for formatting
+        for tag, options in tags.items():
+            text_widget.tag_configure(tag, **options)
+        
+        return text_widget
         
-        # Create canvas for the gauge
-        canvas = tk.Canvas(frame, width=width, height=height-30, 
-                           bg=ThemeManager.COLORS['card'], highlightthickness=0)
-        canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-        
-        # Add label
-        header = ttk.Label(frame, text=label, style="SubHeader.TLabel")
-        header.pack(side=tk.TOP, pady=(0, 5))
-        
-        # Add value display with units
-        value_var = tk.StringVar(value=f"{initial_val} {unit}")
-        value_label = ttk.Label(frame, textvariable=value_var, font=("Arial", 14))
-        value_label.pack(side=tk.TOP)
-        
-        # Draw the gauge
-        def draw_gauge(value):
-            canvas.delete("gauge")
-            
-            # Calculate position
-            value = max(min_val, min(value, max_val))  # Clamp value
-            angle_range = 120  # Degrees
-            start_angle = 180 + (angle_range / 2)  # Start from bottom left
-            
-            # Calculate angle based on value
-            ratio = (value - min_val) / (max_val - min_val)
-            angle = start_angle - (ratio * angle_range)
-            
-            # Determine color based on thresholds
-            color = ThemeManager.COLORS['accent']  # Default green
-            if danger_threshold is not None and value >= danger_threshold:
-                color = ThemeManager.COLORS['danger']
-            elif warning_threshold is not None and value >= warning_threshold:
-                color = ThemeManager.COLORS['warning']
-            
-            # Draw background arc
-            cx = width / 2
-            cy = (height - 30) - 10  # center y with some padding
-            radius = min(cx, cy) - 10
-            
-            # Background arc (gray)
-            start_rad = np.deg2rad(start_angle)
-            end_rad = np.deg2rad(start_angle - angle_range)
-            
-            # Create points for background arc
-            bg_points = []
-            for i in range(int(start_angle), int(start_angle - angle_range - 1), -5):
-                rad = np.deg2rad(i)
-                x = cx + radius * np.cos(rad)
-                y = cy + radius * np.sin(rad)
-                bg_points.extend([x, y])
-            
-            if bg_points:
-                canvas.create_line(bg_points, fill="#CCCCCC", width=5, smooth=True, tags="gauge")
-            
-            # Value arc (colored)
-            val_points = []
-            for i in range(int(start_angle), int(angle - 1), -5):
-                rad = np.deg2rad(i)
-                x = cx + radius * np.cos(rad)
-                y = cy + radius * np.sin(rad)
-                val_points.extend([x, y])
-            
-            if val_points:
-                canvas.create_line(val_points, fill=color, width=5, smooth=True, tags="gauge")
-            
-            # Draw min and max labels
-            canvas.create_text(cx - radius * 0.8, cy + 15, 
-                               text=str(min_val), fill=ThemeManager.COLORS['text_dark'],
-                               font=("Arial", 8), tags="gauge")
-            canvas.create_text(cx + radius * 0.8, cy + 15, 
-                               text=str(max_val), fill=ThemeManager.COLORS['text_dark'],
-                               font=("Arial", 8), tags="gauge")
-            
-            # Update the displayed value
-            value_var.set(f"{value} {unit}")
-        
-        # Initial draw
-        draw_gauge(initial_val)
-        
-        # Create update method
-        def update_value(new_value):
-            draw_gauge(new_value)
+    @staticmethod
+    def create_scrolled_tree(parent, columns, height=10):
+        """
+        Create a Treeview and its scrollbar packed directly into parent
+        columns is a sequence of (column, heading, width, anchor)
+        """
+        tree = ttk.Treeview(parent, columns=[spec[0] for spec in columns], show="headings",
+                            style=CARD_TREEVIEW, height=height)
+        for column, heading, width, anchor in columns:
+            tree.heading(column, text=heading)
+            tree.column(column, width=width, anchor=anchor)
+        
+        # The scrollbar is wired up by the caller (see VirtualTreeview)
+        scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 10), pady=10)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=10)
+        
+        return tree, scrollbar
         
-        # Attach the method to the frame
-        frame.update_value = update_value
+    @staticmethod
+    def set_rich_text(text_widget, segments, keep_view=False):
+        """
+        Replace the contents of a read-only Text widget with (tag, text) segments
+        keep_view keeps the scroll position instead of showing the new text from the top
+        """
+        if keep_view:
+            top = text_widget.yview()[0]
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete(1.0, tk.END)
+        
+        # Merge adjacent segments sharing a tag, then insert everything in one call
+        # using Tk's alternating chars/tagList arguments
+        runs = []
+        for tag, text in segments:
+            if runs and runs[-1][0] == tag:
+                runs[-1][1].append(text)
+            else:
+                runs.append((tag, [text]))
+        
+        args = []
+        for tag, texts in runs:
+            args += ("".join(texts), tag or ())
+        if args:
+            text_widget.insert(tk.END, *args)
+        if keep_view:
+            text_widget.yview_moveto(top)
+        
+        text_widget.config(state=tk.DISABLED)
         
-        return frame
+    @staticmethod
+    def draw_gauge_arc(canvas, cx, cy, radius, min_val, max_val, value,
+                       warning_threshold=None, danger_threshold=None, tags="gauge", value_tags=None):
+        """
+        Draw a gauge arc with min/max labels on a canvas and return the clamped value
+        value_tags tags the colored value arc separately (defaults to tags)
+        """
+        colors = ThemeManager.COLORS
+        angle_range = 120  # Degrees
+        start_angle = 180 - (angle_range / 2)  # Tk measures counterclockwise from 3 o'clock
+        
+        # Background arc (gray)
+        canvas.create_arc(cx - radius, cy - radius, cx + radius, cy + radius, start=start_angle,
+                          extent=angle_range, style=tk.ARC, outline="#CCCCCC", width=5, tags=tags)
+        
+        # Draw min and max labels
+        canvas.create_text(cx - radius * 0.8, cy + 15, 
+                           text=str(min_val), fill=colors['text_dark'],
+                           font=("Arial", 8), tags=tags)
+        canvas.create_text(cx + radius * 0.8, cy + 15, 
+                           text=str(max_val), fill=colors['text_dark'],
+                           font=("Arial", 8), tags=tags)
+        
+        return VisualComponents.draw_gauge_value(canvas, cx, cy, radius, min_val, max_val, value,
+                                                 warning_threshold, danger_threshold, value_tags or tags)
+    
+    @staticmethod
+    def draw_gauge_value(canvas, cx, cy, radius, min_val, max_val, value,
+                         warning_threshold=None, danger_threshold=None, tags="gauge", item=None):
+        """
+        Draw only the colored value arc of a gauge and return the clamped value
+        If item is an existing value arc only its extent and color are changed
+        """
+        colors = ThemeManager.COLORS
+        value = max(min_val, min(value, max_val))  # Clamp value
+        angle_range = 120  # Degrees
+        start_angle = 180 - (angle_range / 2)  # Tk measures counterclockwise from 3 o'clock
+        
+        # Calculate the arc extent based on value
+        ratio = (value - min_val) / (max_val - min_val)
+        extent = ratio * angle_range
+        
+        # Determine color based on thresholds
+        color = colors['accent']  # Default green
+        if danger_threshold is not None and value >= danger_threshold:
+            color = colors['danger']
+        elif warning_threshold is not None and value >= warning_threshold:
+            color = colors['warning']
+        
+        # Value arc (colored), hidden at the minimum where it would be an empty arc
+        state = tk.NORMAL if extent else tk.HIDDEN
+        if item is None:
+            canvas.create_arc(cx - radius, cy - radius, cx + radius, cy + radius, start=start_angle,
+                              extent=extent, style=tk.ARC, outline=color, width=5, state=state, tags=tags)
+        else:
+            canvas.itemconfigure(item, extent=extent, outline=color, state=state)
+        
+        return value
     
     @staticmethod
     def setup_charts(fig, axes):
-        """Set up the trend charts with better styling"""
+        """
+        Set up the trend charts with better styling and create their plot artists once
+        Returns the artists that update_charts refreshes in place; calling it again
+        for the same figure returns the existing artists instead of drawing a second set
+        """
+        if hasattr(fig, '_health_artists'):
+            return fig._health_artists
+        
+        colors = ThemeManager.COLORS
         
         # Apply style to all subplots
         for ax in axes.flat:
@@ -155,92 +211,148 @@ class VisualComponents:
             ax.spines['right'].set_visible(False)
             ax.spines['bottom'].set_color('#CCCCCC')
             ax.spines['left'].set_color('#CCCCCC')
-            ax.tick_params(colors='#666666')
             ax.set_xlabel('Time', color='#666666', fontsize=9)
             
+            # Timestamps are passed as matplotlib date numbers
+            ax.xaxis_date()
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+            ax.tick_params(axis='x', rotation=45, colors='#666666', labelsize=8)
+            ax.tick_params(axis='y', colors='#666666', labelsize=8)
+        
+        line_style = dict(marker='o', markersize=3, linewidth=2)
+        
         # Heart Rate plot
-        axes[0, 0].set_title('Heart Rate', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
+        axes[0, 0].set_title('Heart Rate', color=colors['primary'], fontsize=12, fontweight='bold')
         axes[0, 0].set_ylabel('BPM', color='#666666', fontsize=9)
+        hr_line, = axes[0, 0].plot([], [], color=colors['danger'], **line_style)
+        axes[0, 0].axhspan(60, 100, alpha=0.1, color=colors['accent'], label='Normal Range')
         
         # Blood Pressure plot
-        axes[0, 1].set_title('Blood Pressure', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
+        axes[0, 1].set_title('Blood Pressure', color=colors['primary'], fontsize=12, fontweight='bold')
         axes[0, 1].set_ylabel('mmHg', color='#666666', fontsize=9)
+        sys_line, = axes[0, 1].plot([], [], color=colors['danger'], label='Systolic', **line_style)
+        dia_line, = axes[0, 1].plot([], [], color=colors['info'], label='Diastolic', **line_style)
+        axes[0, 1].axhspan(120, 129, alpha=0.1, color='yellow', label='Elevated (Systolic)')
+        axes[0, 1].axhspan(70, 80, alpha=0.1, color=colors['accent'], label='Normal (Diastolic)')
         
         # Oxygen Level plot
-        axes[1, 0].set_title('Oxygen Level', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
+        axes[1, 0].set_title('Oxygen Level', color=colors['primary'], fontsize=12, fontweight='bold')
         axes[1, 0].set_ylabel('SpO2 %', color='#666666', fontsize=9)
+        ox_line, = axes[1, 0].plot([], [], color=colors['info'], **line_style)
+        axes[1, 0].axhspan(95, 100, alpha=0.1, color=colors['accent'], label='Normal Range')
+        axes[1, 0].axhspan(90, 94, alpha=0.1, color='yellow', label='Concerning Range')
         
         # Temperature plot
-        axes[1, 1].set_title('Temperature', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
+        axes[1, 1].set_title('Temperature', color=colors['primary'], fontsize=12, fontweight='bold')
         axes[1, 1].set_ylabel('°C', color='#666666', fontsize=9)
+        temp_line, = axes[1, 1].plot([], [], color=colors['warning'], **line_style)
+        axes[1, 1].axhspan(36.5, 37.5, alpha=0.1, color=colors['accent'], label='Normal Range')
+        
+        # Shaded areas under the lines (and between systolic and diastolic),
+        # reshaped by update_charts
+        fills = (
+            axes[0, 0].fill_between([], [], alpha=0.1, color=colors['danger']),
+            axes[0, 1].fill_between([], [], [], alpha=0.1, color=colors['secondary']),
+            axes[1, 0].fill_between([], [], alpha=0.1, color=colors['info']),
+            axes[1, 1].fill_between([], [], alpha=0.1, color=colors['warning'])
+        )
+        
+        # Markers for readings whose overall status is Danger, then the legends
+        alerts = []
+        for ax in axes.flat:
+            alerts.append(ax.scatter([], [], color=colors['danger'], marker='x', s=30,
+                                     zorder=3, label='Alert'))
+            ax.legend(loc='upper right', frameon=True, fontsize=8)
         
         # Format figures
         fig.tight_layout(pad=3.0)
         
-    @staticmethod
-    def update_charts(axes, timestamps, heart_rates, bp_systolic, bp_diastolic, oxygen_levels, temperatures):
-        """Update the trend charts with data"""
-        
-        # Clear previous plots
-        for ax in axes.flat:
-            ax.clear()
-            ax.grid(True, linestyle='--', alpha=0.7, color='#EEEEEE')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-        
-        # Plot heart rate with improved styling
-        axes[0, 0].plot(timestamps, heart_rates, color=ThemeManager.COLORS['danger'], 
-                       marker='o', markersize=3, linewidth=2)
-        axes[0, 0].fill_between(timestamps, heart_rates, alpha=0.1, color=ThemeManager.COLORS['danger'])
-        axes[0, 0].set_title('Heart Rate', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
-        axes[0, 0].set_ylabel('BPM', color='#666666', fontsize=9)
-        
-        # Reference ranges for heart rate
-        axes[0, 0].axhspan(60, 100, alpha=0.1, color=ThemeManager.COLORS['accent'], label='Normal Range')
-        
-        # Plot blood pressure with improved styling
-        axes[0, 1].plot(timestamps, bp_systolic, color=ThemeManager.COLORS['danger'], 
-                      marker='o', markersize=3, linewidth=2, label='Systolic')
-        axes[0, 1].plot(timestamps, bp_diastolic, color=ThemeManager.COLORS['info'], 
-                      marker='o', markersize=3, linewidth=2, label='Diastolic')
-        axes[0, 1].fill_between(timestamps, bp_systolic, bp_diastolic, alpha=0.1, 
-                             color=ThemeManager.COLORS['secondary'])
-        axes[0, 1].set_title('Blood Pressure', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
-        axes[0, 1].set_ylabel('mmHg', color='#666666', fontsize=9)
-        axes[0, 1].legend(loc='upper right', frameon=True, fontsize=8)
-        
-        # Reference ranges for blood pressure
-        axes[0, 1].axhspan(120, 129, alpha=0.1, color='yellow', label='Elevated (Systolic)')
-        axes[0, 1].axhspan(70, 80, alpha=0.1, color=ThemeManager.COLORS['accent'], label='Normal (Diastolic)')
+        fig._health_artists = {
+            'lines': (hr_line, sys_line, dia_line, ox_line, temp_line),
+            'alerts': alerts,
+            'fills': fills
+        }
+        return fig._health_artists
         
-        # Plot oxygen level with improved styling
-        axes[1, 0].plot(timestamps, oxygen_levels, color=ThemeManager.COLORS['info'], 
-                      marker='o', markersize=3, linewidth=2)
-        axes[1, 0].fill_between(timestamps, oxygen_levels, alpha=0.1, color=ThemeManager.COLORS['info'])
-        axes[1, 0].set_title('Oxygen Level', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
-        axes[1, 0].set_ylabel('SpO2 %', color='#666666', fontsize=9)
-        
-        # Reference ranges for oxygen
-        axes[1, 0].axhspan(95, 100, alpha=0.1, color=ThemeManager.COLORS['accent'], label='Normal Range')
-        axes[1, 0].axhspan(90, 94, alpha=0.1, color='yellow', label='Concerning Range')
+    @staticmethod
+    def fill_polygon(x, y1, y2=0):
+        """Return the (N, 2) vertices of the area between y1 and y2 over x, as fill_between draws it"""
+        upper = np.column_stack((x, y1))
+        lower = np.column_stack((x, np.broadcast_to(y2, np.shape(x))))
+        return np.concatenate((upper, lower[::-1]))
         
-        # Plot temperature with improved styling
-        axes[1, 1].plot(timestamps, temperatures, color=ThemeManager.COLORS['warning'], 
-                      marker='o', markersize=3, linewidth=2)
-        axes[1, 1].fill_between(timestamps, temperatures, alpha=0.1, color=ThemeManager.COLORS['warning'])
-        axes[1, 1].set_title('Temperature', color=ThemeManager.COLORS['primary'], fontsize=12, fontweight='bold')
-        axes[1, 1].set_ylabel('°C', color='#666666', fontsize=9)
+    @staticmethod
+    def lttb_indices(x, y, threshold=800, min_points=1000):
+        """
+        Pick the indices of up to threshold points that preserve the shape of a series
+        (Largest-Triangle-Three-Buckets); series of at most min_points are kept whole
+        """
+        n = len(x)
+        if n <= min_points or threshold < 3:
+            return np.arange(n)
+        
+        # First and last points are always kept; the rest is split into equal buckets
+        every = (n - 2) / (threshold - 2)
+        indices = np.empty(threshold, dtype=np.intp)
+        indices[0] = a = 0
+        for i in range(threshold - 2):
+            start = int(i * every) + 1
+            end = int((i + 1) * every) + 1
+            next_end = min(int((i + 2) * every) + 1, n)
+            
+            # Keep the point forming the largest triangle with the last kept point
+            # and the average of the next bucket
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+            area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+            a = start + int(area.argmax())
+            indices[i + 1] = a
+        indices[-1] = n - 1
         
-        # Reference ranges for temperature
-        axes[1, 1].axhspan(36.5, 37.5, alpha=0.1, color=ThemeManager.COLORS['accent'], label='Normal Range')
+        return indices
         
-        # Format x-axis for all plots
-        for ax in axes.flat:
-            ax.set_xlabel('Time', color='#666666', fontsize=9)
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-            ax.tick_params(axis='x', rotation=45, colors='#666666', labelsize=8)
-            ax.tick_params(axis='y', colors='#666666', labelsize=8)
-
-            ax.legend(loc='upper right', frameon=True, fontsize=8)
-                    
-
+    @staticmethod
+    def update_charts(axes, artists, timestamps, heart_rates, bp_systolic, bp_diastolic, oxygen_levels, temperatures,
+                      alert_mask=None):
+        """
+        Update the artists created by setup_charts with new data, marking readings
+        flagged in alert_mask; the caller redraws the canvas
+        """
+        x = mdates.date2num(timestamps)
+        heart_rates, bp_systolic, bp_diastolic, oxygen_levels, temperatures = (
+            np.asarray(values, dtype=np.float64)
+            for values in (heart_rates, bp_systolic, bp_diastolic, oxygen_levels, temperatures))
+        
+        # Long series are drawn from a visually equivalent subset of points;
+        # systolic and diastolic share one subset so the band between them lines up
+        hr_idx = VisualComponents.lttb_indices(x, heart_rates)
+        bp_idx = VisualComponents.lttb_indices(x, bp_systolic)
+        ox_idx = VisualComponents.lttb_indices(x, oxygen_levels)
+        temp_idx = VisualComponents.lttb_indices(x, temperatures)
+        
+        hr_line, sys_line, dia_line, ox_line, temp_line = artists['lines']
+        hr_line.set_data(x[hr_idx], heart_rates[hr_idx])
+        sys_line.set_data(x[bp_idx], bp_systolic[bp_idx])
+        dia_line.set_data(x[bp_idx], bp_diastolic[bp_idx])
+        ox_line.set_data(x[ox_idx], oxygen_levels[ox_idx])
+        temp_line.set_data(x[temp_idx], temperatures[temp_idx])
+        
+        # Reshape the shaded areas to the new series
+        hr_fill, bp_fill, ox_fill, temp_fill = artists['fills']
+        hr_fill.set_verts([VisualComponents.fill_polygon(x[hr_idx], heart_rates[hr_idx])])
+        bp_fill.set_verts([VisualComponents.fill_polygon(x[bp_idx], bp_systolic[bp_idx], bp_diastolic[bp_idx])])
+        ox_fill.set_verts([VisualComponents.fill_polygon(x[ox_idx], oxygen_levels[ox_idx])])
+        temp_fill.set_verts([VisualComponents.fill_polygon(x[temp_idx], temperatures[temp_idx])])
+        
+        # Mark readings whose overall status is Danger (from the full series)
+        if alert_mask is None:
+            alert_mask = np.zeros(len(x), dtype=bool)
+        for scatter, values in zip(artists['alerts'], (heart_rates, bp_systolic, oxygen_levels, temperatures)):
+            scatter.set_offsets(np.column_stack((x[alert_mask], values[alert_mask])))
+        
+        # Rescale to the new data (relim skips collections, so add the shaded areas)
+        for ax, fill in zip(axes.flat, artists['fills']):
+            ax.relim()
+            for path in fill.get_paths():
+                ax.update_datalim(path.vertices)
+            ax.autoscale_view()